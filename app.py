@@ -1,10 +1,14 @@
 import streamlit as st
-import os
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
-from datetime import datetime, date
+from datetime import date
+
+from backend import import_profile
+
+import_profile.install()  # records imports per rerun when RESUME_IMPORT_PROFILE=1
+import_mark = import_profile.mark()
 
+from backend import results_archive, results_db, results_export
+from backend.results_store import clear_results, migrate_legacy_results
+from backend.timing import STAGES
 
 LOGO_PATH = "logo.png"  # optional logo in same folder
 
@@ -24,27 +28,17 @@ except Exception:
     st.write("")  # no logo found
 
 # ====== DATA SETUP ======
-os.makedirs("data", exist_ok=True)
-results_file = os.path.join("data", "results.json")
+# One-time move of the old data/results.json array into the append-only log
+migrate_legacy_results()
 
-if not os.path.exists(results_file):
-    with open(results_file, "w", encoding="utf-8") as f:
-        json.dump([], f)
+# Move a large results log into the date-partitioned Parquet archive (needs pyarrow)
+if results_archive.archive_installed():
+    results_db.compact(min_bytes=results_db.COMPACT_MIN_BYTES)
 
-with open(results_file, "r", encoding="utf-8") as f:
-    try:
-        results = json.load(f)
-    except Exception:
-        results = []
-
-df = pd.DataFrame(results)
-
-# Normalize types
-if not df.empty:
-    if "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-    if "score" in df.columns:
-        df["score"] = pd.to_numeric(df["score"], errors="coerce")
+# Ingest new lines of data/results.jsonl into the indexed SQLite copy;
+# filters and KPIs below are answered by SQL instead of loading every row
+results_db.sync()
+total_records = results_db.total_count()
 
 # ====== STYLES ======
 st.markdown(
@@ -85,23 +79,21 @@ end_date = None
 with st.sidebar:
     st.header("Filters")
 
-    if df.empty:
+    if total_records == 0:
         st.info("No analysis records yet. Go to Resume Analyzer page and run some analyses.")
     else:
         # Job filter
-        if "job_title" in df.columns:
-            job_titles = sorted(df["job_title"].dropna().unique().tolist())
-        else:
-            job_titles = []
+        job_titles = results_db.job_titles()
         selected_job = st.selectbox("Filter by job title", ["All"] + job_titles)
 
         # Score filter
         min_score = st.slider("Minimum match score (%)", 0, 100, 0)
 
         # ===== FREE DATE RANGE: user decides FROM and TO =====
-        if "timestamp" in df.columns and df["timestamp"].notna().any():
-            data_min_date = df["timestamp"].min().date()
-            data_max_date = df["timestamp"].max().date()
+        first_ts, last_ts = results_db.date_bounds()
+        if first_ts is not None:
+            data_min_date = first_ts.date()
+            data_max_date = last_ts.date()
             today = date.today()
 
             # default range: from first record to today (or last record if in future)
@@ -146,50 +138,51 @@ with st.sidebar:
 
         st.markdown("---")
 
-        # Download all data
-        csv_data = df.to_csv(index=False).encode("utf-8")
-        st.download_button(
-            "⬇️ Download All Results (CSV)",
-            csv_data,
-            "resume_results.csv",
-            "text/csv",
+        # Export: only generated when asked for, streamed from the store in batches
+        export_fmt = st.selectbox(
+            "Export format",
+            results_export.available_formats(),
+            format_func=lambda f: results_export.FORMATS[f][0],
         )
+        export_filtered = st.checkbox("Only export the current filters", value=False)
+        export_filters = {}
+        if export_filtered:
+            export_filters = {"job_title": selected_job, "min_score": min_score,
+                              "start_date": start_date, "end_date": end_date}
+        # a prepared export is only offered while the format and filters it was made with still apply
+        export_key = repr((export_fmt, sorted(export_filters.items())))
+        if st.session_state.get("export_key") != export_key:
+            st.session_state.pop("export", None)
+        if st.button("📦 Prepare export"):
+            st.session_state["export_key"] = export_key
+            st.session_state["export"] = (
+                export_fmt,
+                results_export.export_bytes(export_fmt, **export_filters),
+            )
+        if "export" in st.session_state:
+            ready_fmt, ready_data = st.session_state["export"]
+            _, file_name, mime = results_export.FORMATS[ready_fmt]
+            st.download_button("⬇️ Download Results", ready_data, file_name, mime)
 
         # Clear all data (admin)
         if st.button("🗑️ Clear All Data"):
-            with open(results_file, "w", encoding="utf-8") as f:
-                json.dump([], f)
+            clear_results()
+            results_archive.clear_archive()
+            results_db.reset()
+            st.session_state.pop("export", None)
             st.success("All analysis data cleared. Reload the page.")
             st.stop()
 
 # ======================================================
-# 🔥 APPLY FILTERS
+# 🔥 APPLY FILTERS (compiled to SQL, only matching rows are loaded)
 # ======================================================
-filtered = df.copy()
-
-if not filtered.empty:
-    # Job filter
-    if selected_job != "All" and "job_title" in filtered.columns:
-        filtered = filtered[filtered["job_title"] == selected_job]
-
-    # Score filter
-    if "score" in filtered.columns:
-        filtered = filtered[filtered["score"] >= min_score]
-
-    # Date range filter (user-chosen FROM / TO)
-    if (
-        start_date is not None
-        and end_date is not None
-        and "timestamp" in filtered.columns
-    ):
-        # Clamp only for filtering logic:
-        #   - if start_date < data_min_date, we still compare against it, but effect is same
-        #   - if end_date > today, we still compare against it, but no future records anyway
-        start_dt = datetime.combine(start_date, datetime.min.time())
-        end_dt = datetime.combine(end_date, datetime.max.time())
-        filtered = filtered[
-            (filtered["timestamp"] >= start_dt) & (filtered["timestamp"] <= end_dt)
-        ]
+filters = {"job_title": selected_job, "min_score": min_score}
+if start_date is not None and end_date is not None:
+    filters.update(start_date=start_date, end_date=end_date)
+
+# KPIs, histogram and skill summary merge the day x job rollup buckets,
+# so their cost does not grow with the number of stored analyses
+kpi = results_db.kpis(**filters)
 
 # ======================================================
 # 🔥 DASHBOARD KPI CARDS
@@ -199,9 +192,9 @@ col1, col2, col3, col4 = st.columns(4)
 with col1:
     st.markdown("<div class='card'>", unsafe_allow_html=True)
     st.subheader("Analyses")
-    st.markdown(f"<div class='kpi'>{len(filtered)}</div>", unsafe_allow_html=True)
+    st.markdown(f"<div class='kpi'>{kpi['count']}</div>", unsafe_allow_html=True)
     st.markdown(
-        f"<div class='muted'>Filtered from {len(df)} total</div>",
+        f"<div class='muted'>Filtered from {total_records} total</div>",
         unsafe_allow_html=True,
     )
     st.markdown("</div>", unsafe_allow_html=True)
@@ -209,34 +202,19 @@ with col1:
 with col2:
     st.markdown("<div class='card'>", unsafe_allow_html=True)
     st.subheader("Avg Score")
-    avg_score = (
-        round(filtered["score"].mean(), 2)
-        if (not filtered.empty and "score" in filtered.columns)
-        else 0
-    )
-    st.markdown(f"<div class='kpi'>{avg_score}%</div>", unsafe_allow_html=True)
+    st.markdown(f"<div class='kpi'>{kpi['avg_score']}%</div>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 with col3:
     st.markdown("<div class='card'>", unsafe_allow_html=True)
     st.subheader("Jobs Analyzed")
-    job_count = (
-        filtered["job_title"].nunique()
-        if (not filtered.empty and "job_title" in filtered.columns)
-        else 0
-    )
-    st.markdown(f"<div class='kpi'>{job_count}</div>", unsafe_allow_html=True)
+    st.markdown(f"<div class='kpi'>{kpi['job_count']}</div>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
 with col4:
     st.markdown("<div class='card'>", unsafe_allow_html=True)
     st.subheader("Top Missing Skill")
-    miss = []
-    if not filtered.empty and "missing_skills" in filtered.columns:
-        for s in filtered["missing_skills"]:
-            if isinstance(s, list):
-                miss.extend(s)
-    top_missing = pd.Series(miss).value_counts().index[0] if miss else "—"
+    top_missing = kpi["top_missing"] or "—"
     st.markdown(f"<div class='kpi'>{top_missing}</div>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -245,22 +223,29 @@ st.markdown("---")
 # ======================================================
 # 🔥 MESSAGE IF NO DATA AFTER FILTERS
 # ======================================================
-if filtered.empty:
+if kpi["count"] == 0:
     st.warning(
         "No records found for the selected filters (job, score, date range). "
         "If you selected dates before analyses started or only future dates, there will be no data."
     )
     st.stop()
 
+# pandas and matplotlib load only once there is data to show
+import pandas as pd
+from matplotlib.figure import Figure
+
 # ======================================================
 # 🔥 SCORE DISTRIBUTION
 # ======================================================
 st.subheader("Score Distribution (Filtered)")
-if "score" not in filtered.columns:
+hist = results_db.score_histogram(**filters)
+if not any(hist):
     st.info("No score data available.")
 else:
-    fig, ax = plt.subplots(figsize=(8, 3))
-    ax.hist(filtered["score"].dropna(), bins=10, edgecolor="white")
+    width = 100 / len(hist)
+    fig = Figure(figsize=(8, 3))  # not pyplot: its global figure registry grows every rerun
+    ax = fig.subplots()
+    ax.bar([i * width for i in range(len(hist))], hist, width=width, align="edge", edgecolor="white")
     ax.set_xlabel("Score (%)")
     ax.set_ylabel("Count")
     st.pyplot(fig)
@@ -268,58 +253,113 @@ else:
 # ======================================================
 # 🔥 RECENT ANALYSES
 # ======================================================
+RECENT_PAGE_SIZE = 10
+
 st.subheader("Recent Analyses (Filtered)")
-if "timestamp" in filtered.columns:
-    recent = filtered.sort_values("timestamp", ascending=False).head(10)
-    recent_display = recent.copy()
-    recent_display["timestamp"] = recent_display["timestamp"].dt.strftime(
-        "%Y-%m-%d %H:%M"
-    )
-else:
-    recent_display = filtered.copy()
 
-cols_to_show = [
-    c for c in ["timestamp", "candidate_name", "job_title", "score"]
-    if c in recent_display.columns
-]
-st.dataframe(recent_display[cols_to_show], use_container_width=True)
+# Keyset pagination: the session keeps the cursor of every page seen so far,
+# "Next" pushes one and "Previous" pops one. New filters start from page 1.
+filter_key = repr(sorted(filters.items()))
+if st.session_state.get("recent_filters") != filter_key:
+    st.session_state["recent_filters"] = filter_key
+    st.session_state["recent_cursors"] = []
+cursors = st.session_state["recent_cursors"]
+
+page_rows, next_cursor = results_db.recent_page(
+    page_size=RECENT_PAGE_SIZE, cursor=cursors[-1] if cursors else None, **filters
+)
+
+
+def _format_ts(values):
+    return pd.to_datetime(values, errors="coerce", format="ISO8601").dt.strftime("%Y-%m-%d %H:%M")
+
+
+cols_to_show = ["timestamp", "candidate_name", "job_title", "score"]
+recent_display = pd.DataFrame(page_rows, columns=cols_to_show)
+recent_display["timestamp"] = _format_ts(recent_display["timestamp"])
+st.dataframe(recent_display, use_container_width=True)
+
+col_prev, col_page, col_next = st.columns([1, 4, 1])
+with col_prev:
+    st.button("◀ Previous", disabled=not cursors, on_click=lambda: cursors.pop())
+with col_page:
+    st.caption(f"Page {len(cursors) + 1}")
+with col_next:
+    st.button("Next ▶", disabled=next_cursor is None, on_click=lambda: cursors.append(next_cursor))
+
+# Drill-down into one analysis and the candidate's other analyses
+with st.expander("🔎 Candidate details"):
+    picked = st.selectbox(
+        "Analysis",
+        range(len(page_rows)),
+        format_func=lambda i: (
+            f"{recent_display['timestamp'][i] or '—'} · {page_rows[i]['candidate_name']} · "
+            f"{page_rows[i]['job_title']} · {page_rows[i]['score']}%"
+        ),
+    )
+    if picked is not None:
+        row = page_rows[picked]
+        st.markdown(f"**Matched skills:** {', '.join(row['resume_skills']) or '—'}")
+        st.markdown(f"**Missing skills:** {', '.join(row['missing_skills']) or '—'}")
+        details = {k: v for k, v in row.items() if k not in ("id", "resume_skills", "missing_skills")}
+        st.json(details, expanded=False)
+
+        history = results_db.fetch_results(
+            candidate_name=row["candidate_name"], order_by="timestamp DESC, id DESC", limit=20
+        )
+        if len(history) > 1:
+            st.markdown("**All analyses for this candidate (latest 20)**")
+            history_display = pd.DataFrame(history, columns=cols_to_show)
+            history_display["timestamp"] = _format_ts(history_display["timestamp"])
+            st.dataframe(history_display, use_container_width=True)
 
 # ======================================================
 # 🔥 SKILL SUMMARY
 # ======================================================
 st.subheader("Skill Match Summary (Top 10, Filtered)")
 
-matched_counts = {}
-missing_counts = {}
+summary_rows = results_db.skill_summary(top=10, **filters)
 
-for _, row in filtered.iterrows():
-    jd = row.get("jd_skills", []) or []
-    rs = row.get("resume_skills", []) or []
-    rs_lower = [x.lower() for x in rs if isinstance(x, str)]
-
-    for s in jd:
-        if not isinstance(s, str):
-            continue
-        if s.lower() in rs_lower:
-            matched_counts[s] = matched_counts.get(s, 0) + 1
-        else:
-            missing_counts[s] = missing_counts.get(s, 0) + 1
-
-skills = set(matched_counts) | set(missing_counts)
+if summary_rows:
+    df_summary = pd.DataFrame(summary_rows, columns=["skill", "matched", "missing"]).set_index("skill")
+    st.bar_chart(df_summary)
+else:
+    st.info("No skill data available for the selected filters.")
 
-if skills:
-    df_summary = pd.DataFrame({"skill": list(skills)})
-    df_summary["matched"] = df_summary["skill"].apply(
-        lambda s: matched_counts.get(s, 0)
+# ======================================================
+# 🔥 LATENCY BY STAGE
+# ======================================================
+st.subheader("Analysis Latency by Stage (Filtered)")
+
+timing_rows = results_db.stage_timings(**filters)
+if timing_rows:
+    df_latency = pd.DataFrame(timing_rows, columns=["job_title", "file_type", "stage", "ms"])
+    df_latency["file_type"] = df_latency["file_type"].replace("", "unknown")
+    stage_order = [s for s in STAGES if s in set(df_latency["stage"])]
+    stage_order += sorted(set(df_latency["stage"]) - set(stage_order))
+
+    overall = df_latency.groupby("stage")["ms"].quantile([0.5, 0.95]).unstack().reindex(stage_order)
+    overall.columns = ["p50 ms", "p95 ms"]
+    st.bar_chart(overall)
+
+    group_by = st.radio(
+        "Break down by", ["job_title", "file_type"], horizontal=True,
+        format_func=lambda c: "Job title" if c == "job_title" else "File type",
     )
-    df_summary["missing"] = df_summary["skill"].apply(
-        lambda s: missing_counts.get(s, 0)
+    breakdown = df_latency.groupby([group_by, "stage"])["ms"].agg(
+        analyses="count", p50=lambda s: s.quantile(0.5), p95=lambda s: s.quantile(0.95)
     )
-    df_summary = df_summary.sort_values("missing", ascending=False).head(10)
-    df_summary = df_summary.set_index("skill")
-    st.bar_chart(df_summary)
+    breakdown = breakdown.unstack("stage").swaplevel(axis=1).reindex(
+        columns=pd.MultiIndex.from_product([stage_order, ["analyses", "p50", "p95"]])
+    )
+    st.dataframe(breakdown.round(1), use_container_width=True)
+    st.caption(f"Milliseconds per stage over the latest {results_db.LATENCY_SAMPLE} timed analyses matching the filters.")
 else:
-    st.info("No skill data available for the selected filters.")
+    st.info("No timed analyses for the selected filters yet.")
+
+if import_profile.ENABLED:
+    with st.sidebar.expander("⏱ Import profile (this rerun)"):
+        st.dataframe(import_profile.events_since(import_mark), use_container_width=True)
 
 st.markdown("---")
 st.markdown(
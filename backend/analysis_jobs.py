@@ -0,0 +1,185 @@
+# backend/analysis_jobs.py
+"""
+The analyzer page's pipelines as background jobs. Each function runs on a
+job-queue thread, reports its stage through job.update() and returns a plain
+result dict the page renders once the job is done.
+"""
+import hashlib
+from datetime import datetime
+
+from backend.batch_analyzer import analyze_many
+from backend.embedding_scorer import embedding_score
+from backend.job_profiles import JOB_PROFILES
+from backend.job_queue import get_job_queue
+from backend.resume_parser import extract_basic_details, extract_text_and_image
+from backend.resume_template import build_docx_from_template_text, generate_resume_template
+from backend.results_store import append_result, append_results, migrate_legacy_results
+from backend.skill_index import get_skill_index
+from backend.skill_catalog import get_catalog
+from backend.tfidf_scorer import tfidf_score
+from backend.timing import Spans, file_type
+
+SINGLE_STAGES = ("parse", "details", "skills", "scores", "template", "save")
+BULK_STAGES = ("analyze", "save")
+
+
+def analyze_single(job, file_bytes, filename, job_title, candidate_name_input="", custom_jd="",
+                   use_tfidf=False, use_embeddings=False):
+    spans = Spans()
+    job.update("parse", message=f"Reading {filename}")
+    with spans.span("parse"):
+        resume_text, image_bytes = extract_text_and_image(file_bytes, filename)
+    if not resume_text.strip():
+        raise ValueError("Could not read any text from the file. Try another resume or format.")
+
+    # --- Extract details ---
+    job.update("details")
+    with spans.span("details"):
+        details = extract_basic_details(resume_text, candidate_name_input)
+    extracted_name = details["name"] or candidate_name_input
+
+    # --- Skills in resume (one scan over the whole skill catalog) ---
+    job.update("skills")
+    with spans.span("skills"):
+        resume_all_skills = get_catalog().find(resume_text)
+    resume_skill_set = set(resume_all_skills)
+
+    # --- JD-specific scoring ---
+    jd_profile = JOB_PROFILES[job_title]
+    jd_skills = jd_profile["skills"]
+    # 🔹 Use custom JD if provided, else default JD
+    jd_text = custom_jd.strip() or jd_profile["jd"]
+
+    job.update("scores")
+    with spans.span("score"):
+        # jd_skills are catalog names, so reuse the scan above
+        matched_skills = [s for s in jd_skills if s in resume_skill_set]
+        missing_skills = [s for s in jd_skills if s not in matched_skills]
+        total = len(jd_skills) if jd_skills else 1
+        score = round(100 * len(matched_skills) / total, 2)
+    # optional model scores get their own stages so they don't show up as skill scoring
+    relevance = semantic = None
+    if use_tfidf:
+        with spans.span("tfidf"):
+            relevance = tfidf_score(resume_text, jd_text)
+    if use_embeddings:
+        with spans.span("embedding"):
+            semantic = embedding_score(resume_text, jd_text)
+
+    job.update("template")
+    with spans.span("template"):
+        template_text = generate_resume_template(
+            job_title=job_title,
+            candidate_name=extracted_name,
+            matched_skills=matched_skills,
+            missing_skills=missing_skills,
+            jd_text=jd_text,
+        )
+    with spans.span("docx"):
+        docx_bytes = build_docx_from_template_text(template_text)
+    base_name = (extracted_name or job_title).replace(" ", "_") or "resume"
+
+    job.update("save")
+    # ===== Update skill -> candidate index for shortlisting =====
+    with spans.span("index"):
+        candidate_id = (details["email"] or "").lower() or hashlib.sha256(file_bytes).hexdigest()
+        get_skill_index().add(candidate_id, extracted_name or filename, resume_all_skills)
+
+    # ===== Save to the results log for dashboard =====
+    record = {
+        "timestamp": datetime.now().isoformat(),
+        "candidate_name": extracted_name or filename,
+        "job_title": job_title,
+        "score": score,
+        "jd_skills": jd_skills,
+        "resume_skills": matched_skills,
+        "missing_skills": missing_skills,
+    }
+    if relevance is not None:
+        record["tfidf_score"] = relevance
+    if semantic is not None:
+        record["embedding_score"] = semantic
+    record["file_type"] = file_type(filename)
+    if spans.timings:
+        # the log append below can't time itself, so the record stops at "index"
+        record["timings"] = dict(spans.timings)
+    with spans.span("save"):
+        migrate_legacy_results()
+        append_result(record)
+
+    return {
+        "details": details,
+        "extracted_name": extracted_name,
+        "image_bytes": image_bytes,
+        "resume_all_skills": resume_all_skills,
+        "matched_skills": matched_skills,
+        "missing_skills": missing_skills,
+        "score": score,
+        "relevance": relevance,
+        "semantic": semantic,
+        "use_embeddings": use_embeddings,
+        "template_text": template_text,
+        "docx_bytes": docx_bytes,
+        "docx_filename": f"{base_name}_resume_template.docx",
+        "timings": spans.timings,
+    }
+
+
+def analyze_bulk(job, files, job_title):
+    """Score (filename, file_bytes) pairs in the process pool; rows stream into job.partial."""
+    jd_skills = JOB_PROFILES[job_title]["skills"]
+    rows = []
+    records = []
+    failed = []
+    index = get_skill_index()
+
+    job.update("analyze", message=f"Analyzing {len(files)} files")
+    for done, res in enumerate(analyze_many(files, job_title, jd_skills), start=1):
+        if res["error"]:
+            failed.append(f"{res['filename']}: {res['error']}")
+        else:
+            rows.append({
+                "file": res["filename"],
+                "candidate_name": res["candidate_name"],
+                "score": res["score"],
+                "matched_skills": ", ".join(res["matched_skills"]),
+                "missing_skills": ", ".join(res["missing_skills"]),
+            })
+            records.append({
+                "timestamp": datetime.now().isoformat(),
+                "candidate_name": res["candidate_name"],
+                "job_title": job_title,
+                "score": res["score"],
+                "jd_skills": jd_skills,
+                "resume_skills": res["matched_skills"],
+                "missing_skills": res["missing_skills"],
+                "file_type": file_type(res["filename"]),
+            })
+            if res["timings"]:
+                records[-1]["timings"] = res["timings"]
+            candidate_id = (res["details"]["email"] or "").lower() or res["sha256"]
+            index.add(candidate_id, res["candidate_name"], res["resume_all_skills"])
+        job.update(
+            "analyze", done / len(files), f"Analyzed {done} of {len(files)}: {res['filename']}",
+            partial=sorted(rows, key=lambda r: r["score"], reverse=True),
+        )
+
+    # ===== Save all records to the results log in one batch =====
+    job.update("save")
+    if records:
+        migrate_legacy_results()
+        append_results(records)
+    return {"rows": sorted(rows, key=lambda r: r["score"], reverse=True), "failed": failed, "saved": len(records)}
+
+
+def submit_single(file_bytes, filename, job_title, **options):
+    return get_job_queue().submit(
+        "single", f"{filename} → {job_title}", SINGLE_STAGES,
+        analyze_single, file_bytes, filename, job_title, **options
+    )
+
+
+def submit_bulk(files, job_title):
+    return get_job_queue().submit(
+        "bulk", f"{len(files)} resumes → {job_title}", BULK_STAGES, analyze_bulk, files, job_title
+    )
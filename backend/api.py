@@ -0,0 +1,388 @@
+# backend/api.py
+"""
+Headless HTTP API over the resume backend, for machine-to-machine use.
+Built on asyncio streams (standard library only); parsing and scoring run in
+the shared process pool so the event loop only does I/O.
+
+    python -m backend.api --host 127.0.0.1 --port 8765
+
+JSON in, JSON out. Files are sent as {"filename": ..., "content": <base64>}.
+
+    GET  /health
+    GET  /profiles                     job profiles and their skills
+    POST /parse      {filename, content}
+    POST /score      {filename, content, job_title | job_description}
+    POST /batch      {resumes: [{filename, content}, ...], job_title | job_description,
+                      top_k?, save?}
+    POST /shortlist  {role | skills, k?}
+
+job_title alone scores against JOB_PROFILES (as the analyzer page does);
+job_description extracts the JD skills from the text and uses compute_score.
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import json
+import signal
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from http import HTTPStatus
+
+from backend.batch_analyzer import _reset_pool, analyze_resume_bytes, analyze_resume_for_jd, get_process_pool
+from backend.feedback_generator import generate_feedback
+from backend.job_profiles import JOB_PROFILES
+from backend.matcher import extract_job_skills
+from backend.resume_parser import extract_basic_details, extract_skills, extract_text_and_image
+from backend.results_store import append_results, migrate_legacy_results
+from backend.skill_catalog import get_catalog
+from backend.skill_index import get_skill_index
+from backend.timing import file_type
+
+MAX_CONCURRENT_REQUESTS = 8   # requests being worked on at once
+MAX_QUEUED_REQUESTS = 64      # beyond this, new requests get 503 instead of waiting
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_BATCH_FILES = 500
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ----- work done in the process pool (module-level so spawned workers can import it) -----
+def parse_resume(file_bytes, filename):
+    text, _ = extract_text_and_image(file_bytes, filename)
+    return {
+        "filename": filename,
+        "text": text,
+        "skills": extract_skills(text),
+        "details": extract_basic_details(text),
+    }
+
+
+def score_resume(file_bytes, filename, job_title, jd_skills, use_profile):
+    """Score one resume; JOB_PROFILES roles use the analyzer's scoring, custom JDs compute_score."""
+    analyze = analyze_resume_bytes if use_profile else analyze_resume_for_jd
+    result = analyze(file_bytes, filename, job_title, jd_skills)
+    if result["error"]:
+        return result
+    feedback = generate_feedback(result["matched_skills"], jd_skills, result["candidate_name"], job_title)
+    result["feedback"] = feedback["summary"]
+    return result
+
+
+# ----- request helpers -----
+def _decode_file(item):
+    if not isinstance(item, dict) or not isinstance(item.get("filename"), str):
+        raise HTTPError(400, "each file needs a filename and base64 content")
+    try:
+        return item["filename"], base64.b64decode(item.get("content") or "", validate=True)
+    except (binascii.Error, TypeError):
+        raise HTTPError(400, f"content of {item['filename']} is not valid base64")
+
+
+def _job_spec(payload):
+    """(job_title, jd_skills, use_profile) from job_title and/or job_description."""
+    job_title = payload.get("job_title") or ""
+    description = payload.get("job_description")
+    if description:
+        return job_title, extract_job_skills(description, job_title), False
+    if job_title in JOB_PROFILES:
+        return job_title, list(JOB_PROFILES[job_title]["skills"]), True
+    raise HTTPError(400, f"unknown job_title {job_title!r}; pass a job_description or one of /profiles")
+
+
+def _positive_int(payload, name, default=None):
+    value = payload.get(name)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise HTTPError(400, f"{name} must be a positive integer")
+    try:
+        value = int(value)
+    except ValueError:
+        raise HTTPError(400, f"{name} must be a positive integer") from None
+    if value < 1:
+        raise HTTPError(400, f"{name} must be a positive integer")
+    return value
+
+
+def _shortlist(target, k):
+    return get_skill_index().top_k(target, k=k)  # get_skill_index() refreshes from disk
+
+
+def _records(results):
+    """Results-log records for successful scores, shaped like the analyzer page's."""
+    now = datetime.now().isoformat()
+    return [
+        {
+            "timestamp": now,
+            "candidate_name": r["candidate_name"],
+            "job_title": r["job_title"],
+            "score": r["score"],
+            "jd_skills": r["jd_skills"],
+            "resume_skills": r["matched_skills"],
+            "missing_skills": r["missing_skills"],
+            "file_type": file_type(r["filename"]),
+            **({"timings": r["timings"]} if r.get("timings") else {}),
+        }
+        for r in results if not r.get("error")
+    ]
+
+
+def _save(results):
+    records = _records(results)
+    if records:
+        migrate_legacy_results()
+        append_results(records)
+        index = get_skill_index()
+        for r in results:
+            if not r.get("error"):
+                candidate_id = (r["details"]["email"] or "").lower() or r["sha256"]
+                index.add(candidate_id, r["candidate_name"], r["resume_all_skills"])
+    return len(records)
+
+
+class ResumeAPI:
+    """Routes requests to handlers and bounds how many run at once."""
+
+    def __init__(self, executor=None, max_concurrent=MAX_CONCURRENT_REQUESTS, max_queued=MAX_QUEUED_REQUESTS):
+        self.executor = executor or get_process_pool()
+        self.max_queued = max_queued
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+        self._connections = {}  # writer -> handler task
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/profiles"): self.profiles,
+            ("POST", "/parse"): self.parse,
+            ("POST", "/score"): self.score,
+            ("POST", "/batch"): self.batch,
+            ("POST", "/shortlist"): self.shortlist,
+        }
+
+    async def _in_pool(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, fn, *args)
+        except BrokenProcessPool:
+            # a worker died (e.g. on a pathological PDF): swap in fresh workers and retry once
+            self._replace_pool()
+        try:
+            return await loop.run_in_executor(self.executor, fn, *args)
+        except BrokenProcessPool:
+            self._replace_pool()
+            raise HTTPError(503, "worker process crashed, retry later") from None
+
+    def _replace_pool(self):
+        broken = self.executor
+        _reset_pool(broken)
+        if self.executor is broken:  # concurrent requests may have replaced it already
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.executor = get_process_pool()
+
+    async def dispatch(self, method, path, body):
+        """(status, payload) for one request."""
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(p == path for _, p in self.routes):
+                raise HTTPError(405, f"{method} not allowed on {path}")
+            raise HTTPError(404, f"no route {path}")
+        payload = {}
+        if method == "POST":
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                raise HTTPError(400, "body must be JSON")
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "body must be a JSON object")
+
+        if self._slots.locked() and self._waiting >= self.max_queued:
+            raise HTTPError(503, "server busy, retry later")
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            return 200, await handler(payload)
+        finally:
+            self._slots.release()
+
+    # ----- handlers -----
+    async def health(self, payload):
+        return {"status": "ok", "skill_catalog": get_catalog().label}
+
+    async def profiles(self, payload):
+        return {title: {"skills": p["skills"]} for title, p in JOB_PROFILES.items()}
+
+    async def parse(self, payload):
+        filename, data = _decode_file(payload)
+        return await self._in_pool(parse_resume, data, filename)
+
+    async def score(self, payload):
+        filename, data = _decode_file(payload)
+        job_title, jd_skills, use_profile = _job_spec(payload)
+        result = await self._in_pool(score_resume, data, filename, job_title, jd_skills, use_profile)
+        if payload.get("save"):
+            await asyncio.get_running_loop().run_in_executor(None, _save, [result])
+        return result
+
+    async def batch(self, payload):
+        resumes = payload.get("resumes")
+        if not isinstance(resumes, list) or not resumes:
+            raise HTTPError(400, "resumes must be a non-empty list")
+        if len(resumes) > MAX_BATCH_FILES:
+            raise HTTPError(413, f"at most {MAX_BATCH_FILES} resumes per batch")
+        files = [_decode_file(item) for item in resumes]
+        job_title, jd_skills, use_profile = _job_spec(payload)
+        top_k = _positive_int(payload, "top_k")
+
+        outcomes = await asyncio.gather(
+            *(self._in_pool(score_resume, data, filename, job_title, jd_skills, use_profile) for filename, data in files),
+            return_exceptions=True,
+        )
+        results = [
+            o if not isinstance(o, BaseException) else {"filename": f[0], "job_title": job_title, "error": str(o)}
+            for f, o in zip(files, outcomes)
+        ]
+        response = {"job_title": job_title, "jd_skills": jd_skills, "results": results}
+        if top_k:
+            ranked = sorted((r for r in results if not r.get("error")), key=lambda r: r["score"], reverse=True)
+            response["shortlist"] = [
+                {"filename": r["filename"], "candidate_name": r["candidate_name"], "score": r["score"]}
+                for r in ranked[:top_k]
+            ]
+        if payload.get("save"):
+            response["saved"] = await asyncio.get_running_loop().run_in_executor(None, _save, results)
+        return response
+
+    async def shortlist(self, payload):
+        target = payload.get("role") or payload.get("skills")
+        if target and isinstance(target, str):
+            if target not in JOB_PROFILES:
+                raise HTTPError(400, f"unknown role {target!r}; pass a list of skills or one of /profiles")
+        elif not (isinstance(target, list) and target and all(isinstance(s, str) for s in target)):
+            raise HTTPError(400, "pass a role (JOB_PROFILES name) or a non-empty list of skills")
+        k = _positive_int(payload, "k", 50)
+        candidates = await asyncio.get_running_loop().run_in_executor(None, _shortlist, target, k)
+        return {"candidates": candidates}
+
+    # ----- HTTP/1.1 over asyncio streams -----
+    async def handle_connection(self, reader, writer):
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, {"error": "headers too large"}, False)
+                    return
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "bad request line"}, False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        k, v = line.split(":", 1)
+                        headers[k.strip().lower()] = v.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0 or "chunked" in headers.get("transfer-encoding", "").lower():
+                    await self._respond(writer, 411, {"error": "send a Content-Length body"}, False)
+                    return
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": f"body over {MAX_BODY_BYTES} bytes"}, False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self.dispatch(method, target.split("?", 1)[0], body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": e.message}
+                except Exception as e:
+                    status, payload = 500, {"error": str(e) or e.__class__.__name__}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def close_connections(self):
+        """Hang up keep-alive clients and let their handlers finish, for a clean shutdown."""
+        tasks = list(self._connections.values())
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8765, api=None):
+    """Start the API server; returns the asyncio.Server (already listening)."""
+    api = api or ResumeAPI()
+    return await asyncio.start_server(api.handle_connection, host, port, limit=64 * 1024)
+
+
+async def _main(host, port, max_concurrent):
+    api = ResumeAPI(max_concurrent=max_concurrent)
+    server = await serve(host, port, api)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Resume API listening on {addrs}")
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except NotImplementedError:  # Windows: Ctrl+C only
+        pass
+    try:
+        async with server:
+            await stop.wait()
+            await api.close_connections()
+    finally:
+        # stop the spawned workers too, or they outlive the server
+        api.executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the headless resume scoring API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-concurrent", type=int, default=MAX_CONCURRENT_REQUESTS,
+                        help="requests processed at once (others wait)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_main(args.host, args.port, args.max_concurrent))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+# backend/batch_analyzer.py
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.job_profiles import JOB_PROFILES
+from backend.matcher import compute_score
+from backend.resume_parser import extract_text_and_image, extract_basic_details
+from backend.skill_catalog import get_catalog, get_skill_matcher
+from backend.timing import Spans
+
+# Bulk and CLI runs may stop reading a PDF once its header details and this many
+# distinct catalog skills have been seen (0 = read every page, up to PDF_MAX_PAGES).
+# Skills mentioned only after that point are missed, so it trades recall for speed.
+BULK_EARLY_EXIT_SKILLS = int(os.environ.get("RESUME_BULK_EARLY_EXIT_SKILLS", "0") or 0) or None
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def analyze_resume_bytes(file_bytes, filename, job_title, jd_skills=None, early_exit_skills=None):
+    """
+    Parse one resume and score it for job_title, the same way the analyzer page does.
+    Runs in worker processes, so it takes and returns plain picklable data.
+    """
+    return _analyze(file_bytes, filename, job_title, jd_skills, False, early_exit_skills)
+
+
+def analyze_resume_for_jd(file_bytes, filename, job_title, jd_skills, early_exit_skills=None):
+    """
+    analyze_resume_bytes for a custom job description: jd_skills come from
+    matcher.extract_job_skills, so matching and the score use its skill list
+    (catalog aliases in the resume count as the listed skill).
+    """
+    return _analyze(file_bytes, filename, job_title, jd_skills, True, early_exit_skills)
+
+
+def _analyze(file_bytes, filename, job_title, jd_skills, custom_jd, early_exit_skills):
+    result = {
+        "filename": filename,
+        "job_title": job_title,
+        "sha256": hashlib.sha256(file_bytes).hexdigest(),
+        "error": None,
+    }
+    spans = Spans()
+    try:
+        with spans.span("parse"):
+            text, _ = extract_text_and_image(file_bytes, filename, early_exit_skills=early_exit_skills)
+    except Exception as e:
+        result["error"] = f"Could not parse file: {e}"
+        return result
+    if not text.strip():
+        result["error"] = "Could not read any text from the file."
+        return result
+
+    if jd_skills is None:
+        jd_skills = JOB_PROFILES[job_title]["skills"]
+    with spans.span("details"):
+        details = extract_basic_details(text)
+    with spans.span("skills"):
+        resume_all_skills = get_catalog().find(text)
+    with spans.span("score"):
+        if custom_jd:
+            # custom JD skills need not be catalog names, so match them in the text directly
+            matched = get_skill_matcher(jd_skills).find(text)
+            score = compute_score(matched, jd_skills)
+        else:
+            found = set(resume_all_skills)
+            matched = [s for s in jd_skills if s in found]
+            score = round(100 * len(matched) / (len(jd_skills) or 1), 2)
+        missing = [s for s in jd_skills if s not in matched]
+
+    result.update({
+        "candidate_name": details["name"] or filename,
+        "details": details,
+        "resume_all_skills": resume_all_skills,
+        "jd_skills": list(jd_skills),
+        "matched_skills": matched,
+        "missing_skills": missing,
+        "score": score,
+        "timings": spans.timings,
+    })
+    return result
+
+
+def get_process_pool(max_workers=None):
+    """
+    One ProcessPoolExecutor per server process, sized to the machine's cores.
+    Workers are spawned (not forked) because the Streamlit server is multi-threaded.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _reset_pool(executor):
+    """Drop a broken shared pool so the next batch starts fresh workers."""
+    global _pool
+    with _pool_lock:
+        if _pool is executor:
+            _pool = None
+
+
+def analyze_many(files, job_title, jd_skills=None, executor=None, early_exit_skills=BULK_EARLY_EXIT_SKILLS):
+    """
+    Fan (filename, file_bytes) pairs out to the process pool and yield each
+    result as soon as its file finishes (completion order, not input order).
+    """
+    executor = executor or get_process_pool()
+    futures = {
+        executor.submit(analyze_resume_bytes, file_bytes, filename, job_title, jd_skills, early_exit_skills): filename
+        for filename, file_bytes in files
+    }
+    for future in as_completed(futures):
+        try:
+            yield future.result()
+        except BrokenProcessPool as e:
+            _reset_pool(executor)
+            yield {"filename": futures[future], "job_title": job_title, "error": f"Worker crashed: {e}"}
+        except Exception as e:
+            yield {"filename": futures[future], "job_title": job_title, "error": str(e)}
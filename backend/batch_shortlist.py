@@ -0,0 +1,366 @@
+# backend/batch_shortlist.py
+"""
+Rank a folder (or manifest) of resumes for one role, headless.
+
+    python -m backend.batch_shortlist dumps/2024-06-01 --role "Data Scientist" --out shortlist.csv
+    python -m backend.batch_shortlist --manifest files.txt --jd jd.txt --out shortlist.jsonl --top 200
+
+The run is a pipeline of stages joined by bounded queues, so memory stays flat
+however many files there are:
+
+    list files -> read bytes (threads) -> parse, details, skills, score (process pool)
+               -> persist (thread) -> rank and write the shortlist
+
+Scored rows are spooled to a temporary JSONL file as they arrive; only
+(score, offset) pairs stay in memory for the final ranking.
+Parsed resumes are cached in memory only unless --parse-cache is given, so a
+one-off run over a dump does not leave a JSON file per resume in data/parse_cache.
+"""
+import argparse
+import csv
+import heapq
+import json
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.batch_analyzer import (
+    BULK_EARLY_EXIT_SKILLS, _reset_pool, analyze_resume_bytes, analyze_resume_for_jd, get_process_pool,
+)
+from backend.job_profiles import JOB_PROFILES
+from backend.matcher import extract_job_skills
+from backend.results_store import append_results, migrate_legacy_results
+from backend.skill_index import get_skill_index
+from backend.timing import file_type
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt")
+READ_THREADS = 4
+QUEUE_SIZE = 64          # files waiting between stages
+SAVE_BATCH = 500         # records per results-log append with --save
+PROGRESS_EVERY = 500
+OUTPUT_FIELDS = ["rank", "file", "candidate_name", "email", "score", "matched_skills", "missing_skills"]
+
+_DONE = object()
+
+
+def iter_paths(folder=None, manifest=None):
+    """Resume paths under folder (recursive) or listed one per line in manifest, lazily."""
+    if manifest:
+        base = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line if os.path.isabs(line) else os.path.join(base, line)
+        return
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                yield os.path.join(root, name)
+
+
+def _put(q, item, stop):
+    """Blocking put that gives up once the run is being aborted."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q, stop):
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.2)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+class ShortlistPipeline:
+    """
+    One shortlisting run. Pass either job_title from JOB_PROFILES, or
+    jd_text (job_title is then only a hint for extract_job_skills).
+    """
+
+    def __init__(self, job_title="", jd_text=None, workers=None, read_threads=READ_THREADS,
+                 max_in_flight=None, save=False, progress=None, early_exit_skills=BULK_EARLY_EXIT_SKILLS):
+        if jd_text:
+            self.jd_skills = extract_job_skills(jd_text, job_title)
+            self.analyze = analyze_resume_for_jd
+        elif job_title in JOB_PROFILES:
+            self.jd_skills = list(JOB_PROFILES[job_title]["skills"])
+            self.analyze = analyze_resume_bytes
+        else:
+            raise ValueError(f"Unknown role {job_title!r}; pass a JD file or one of: {', '.join(JOB_PROFILES)}")
+        self.job_title = job_title
+        self.workers = workers or os.cpu_count() or 1
+        self.read_threads = max(1, read_threads)
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        self.save = save
+        self.progress = progress
+        self.early_exit_skills = early_exit_skills
+        self.stop = threading.Event()
+        self.executor = None
+        self.scored = 0
+        self.failed = []
+        self.persist_error = None
+        self.saved = 0
+
+    # ----- stage 1 + 2: list files, read bytes (I/O threads) -----
+    def _list(self, paths, path_q):
+        try:
+            for path in paths:
+                if not _put(path_q, path, self.stop):
+                    return
+        finally:
+            for _ in range(self.read_threads):
+                _put(path_q, _DONE, self.stop)
+
+    def _read(self, path_q, bytes_q):
+        try:
+            while True:
+                path = _get(path_q, self.stop)
+                if path is _DONE:
+                    return
+                try:
+                    with open(path, "rb") as f:
+                        item = (path, f.read(), None)
+                except OSError as e:
+                    item = (path, None, f"Could not read file: {e}")
+                if not _put(bytes_q, item, self.stop):
+                    return
+        finally:
+            _put(bytes_q, _DONE, self.stop)
+
+    # ----- stage 3: parse / details / skills / score (process pool) -----
+    def _dispatch(self, bytes_q, result_q, slots):
+        readers_left = self.read_threads
+        while readers_left:
+            item = _get(bytes_q, self.stop)
+            if item is _DONE:
+                if self.stop.is_set():
+                    return
+                readers_left -= 1
+                continue
+            path, data, error = item
+            # a slot covers a file from submission until persist has consumed its result
+            while not slots.acquire(timeout=0.2):
+                if self.stop.is_set():
+                    return
+            if error:
+                result_q.put((path, {"filename": os.path.basename(path), "error": error}))
+                continue
+            args = (data, os.path.basename(path), self.job_title, self.jd_skills, self.early_exit_skills)
+            try:
+                future = self.executor.submit(self.analyze, *args)
+            except BrokenProcessPool:
+                # a worker died (e.g. on a pathological PDF); carry on with fresh workers
+                _reset_pool(self.executor)
+                self.executor = get_process_pool(self.workers)
+                future = self.executor.submit(self.analyze, *args)
+            future.add_done_callback(lambda f, path=path: result_q.put((path, f)))
+        # every slot back means every result has been persisted
+        for _ in range(self.max_in_flight):
+            while not slots.acquire(timeout=0.2):
+                if self.stop.is_set():
+                    return
+        result_q.put(_DONE)
+
+    # ----- stage 4: persist (thread) -----
+    def _persist(self, result_q, slots, spool, ranking):
+        try:
+            self._persist_results(result_q, slots, spool, ranking)
+        except BaseException as e:
+            # no more slots will be released: stop the other stages, run() re-raises
+            self.persist_error = e
+            self.stop.set()
+
+    def _persist_results(self, result_q, slots, spool, ranking):
+        records = []
+        started = time.perf_counter()
+        while True:
+            item = result_q.get()
+            if item is _DONE:
+                break
+            path, outcome = item
+            if isinstance(outcome, dict):
+                res = outcome
+            else:
+                try:
+                    res = outcome.result()
+                except Exception as e:
+                    res = {"filename": os.path.basename(path), "error": f"Worker failed: {e}"}
+            slots.release()
+
+            if res.get("error"):
+                self.failed.append((path, res["error"]))
+            else:
+                row = {
+                    "file": path,
+                    "candidate_name": res["candidate_name"],
+                    "email": res["details"].get("email") or "",
+                    "score": res["score"],
+                    "matched_skills": res["matched_skills"],
+                    "missing_skills": res["missing_skills"],
+                }
+                ranking.append((-res["score"], path, spool.tell()))
+                spool.write(json.dumps(row, ensure_ascii=False).encode("utf-8") + b"\n")
+                if self.save:
+                    records.append((res, path))
+                    if len(records) >= SAVE_BATCH:
+                        self._save(records)
+                        records = []
+            self.scored += 1
+            if self.progress and self.scored % PROGRESS_EVERY == 0:
+                rate = self.scored / (time.perf_counter() - started)
+                self.progress(f"scored {self.scored} ({len(self.failed)} failed), {rate:.1f} files/s")
+        if records:
+            self._save(records)
+
+    def _save(self, batch):
+        now = datetime.now().isoformat()
+        append_results([
+            {
+                "timestamp": now,
+                "candidate_name": res["candidate_name"],
+                "job_title": self.job_title,
+                "score": res["score"],
+                "jd_skills": self.jd_skills,
+                "resume_skills": res["matched_skills"],
+                "missing_skills": res["missing_skills"],
+                "file_type": file_type(res["filename"]),
+                **({"timings": res["timings"]} if res.get("timings") else {}),
+            }
+            for res, _ in batch
+        ])
+        index = get_skill_index()
+        for res, _ in batch:
+            candidate_id = (res["details"]["email"] or "").lower() or res["sha256"]
+            index.add(candidate_id, res["candidate_name"], res["resume_all_skills"])
+        self.saved += len(batch)
+
+    def run(self, paths, out_path, fmt=None, top=None):
+        """Score every path and write the ranked shortlist to out_path; returns the number of rows written."""
+        if self.save:
+            migrate_legacy_results()
+        path_q = queue.Queue(QUEUE_SIZE)
+        bytes_q = queue.Queue(QUEUE_SIZE)
+        result_q = queue.Queue()  # never holds more than max_in_flight items (see slots)
+        slots = threading.Semaphore(self.max_in_flight)
+        ranking = []
+        self.executor = get_process_pool(self.workers)
+
+        with tempfile.TemporaryFile("w+b") as spool:
+            threads = [threading.Thread(target=self._list, args=(paths, path_q), name="shortlist-list", daemon=True)]
+            threads += [
+                threading.Thread(target=self._read, args=(path_q, bytes_q), name=f"shortlist-read-{i}", daemon=True)
+                for i in range(self.read_threads)
+            ]
+            persist = threading.Thread(
+                target=self._persist, args=(result_q, slots, spool, ranking), name="shortlist-persist", daemon=True
+            )
+            for t in threads + [persist]:
+                t.start()
+            try:
+                self._dispatch(bytes_q, result_q, slots)
+                persist.join()
+                if self.persist_error is not None:
+                    raise self.persist_error
+            except BaseException:
+                self.stop.set()
+                _reset_pool(self.executor)  # a later run in this process gets fresh workers
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            for t in threads:
+                t.join()
+
+            order = heapq.nsmallest(top, ranking) if top else sorted(ranking)
+            return write_shortlist(spool, order, out_path, fmt)
+
+
+def write_shortlist(spool, order, out_path, fmt=None):
+    """Copy spooled rows into out_path in ranking order, as CSV or JSONL."""
+    fmt = fmt or ("jsonl" if out_path.lower().endswith((".jsonl", ".json")) else "csv")
+    folder = os.path.dirname(out_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8", newline="") as out:
+        writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS) if fmt == "csv" else None
+        if writer:
+            writer.writeheader()
+        for rank, (_, _, offset) in enumerate(order, start=1):
+            spool.seek(offset)
+            row = {"rank": rank, **json.loads(spool.readline())}
+            if writer:
+                row["matched_skills"] = ", ".join(row["matched_skills"])
+                row["missing_skills"] = ", ".join(row["missing_skills"])
+                writer.writerow(row)
+            else:
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return len(order)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a folder of resumes for one role and write a ranked shortlist.")
+    parser.add_argument("folder", nargs="?", help="folder of resumes (searched recursively)")
+    parser.add_argument("--manifest", help="text file with one resume path per line, instead of a folder")
+    parser.add_argument("--role", default="", help="job title from JOB_PROFILES")
+    parser.add_argument("--jd", help="job description text file (scores against its skills instead of the role's)")
+    parser.add_argument("--out", required=True, help="output file; .csv or .jsonl")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="override the format implied by --out")
+    parser.add_argument("--top", type=int, help="keep only the best N candidates")
+    parser.add_argument("--workers", type=int, help="parser processes (default: CPU count)")
+    parser.add_argument("--read-threads", type=int, default=READ_THREADS)
+    parser.add_argument("--early-exit-skills", type=int, default=BULK_EARLY_EXIT_SKILLS,
+                        help="stop reading a PDF once its contact details and this many catalog skills are found")
+    parser.add_argument("--save", action="store_true", help="also add the results to the dashboard log and skill index")
+    parser.add_argument("--errors", help="write files that could not be scored to this file")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="keep parsed resumes in the on-disk parse cache (default: memory only)")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    if bool(args.folder) == bool(args.manifest):
+        parser.error("give either a folder or --manifest")
+    jd_text = None
+    if args.jd:
+        with open(args.jd, "r", encoding="utf-8") as f:
+            jd_text = f.read()
+    if not args.parse_cache:
+        # read by parse_cache in the pool workers, which are spawned after this point
+        os.environ["RESUME_PARSE_CACHE_DISK"] = "0"
+    log = None if args.quiet else (lambda msg: print(msg, file=sys.stderr, flush=True))
+
+    try:
+        pipeline = ShortlistPipeline(args.role, jd_text, args.workers, args.read_threads, save=args.save, progress=log,
+                                     early_exit_skills=args.early_exit_skills)
+    except ValueError as e:
+        parser.error(str(e))
+    started = time.perf_counter()
+    written = pipeline.run(iter_paths(args.folder, args.manifest), args.out, args.format, args.top)
+    elapsed = time.perf_counter() - started
+
+    if args.errors:
+        with open(args.errors, "w", encoding="utf-8") as f:
+            for path, error in pipeline.failed:
+                f.write(f"{path}\t{error}\n")
+    if log:
+        log(
+            f"Scored {pipeline.scored} files in {elapsed:.1f}s ({len(pipeline.failed)} failed); "
+            f"wrote {written} rows to {args.out}" + (f"; saved {pipeline.saved}" if args.save else "")
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
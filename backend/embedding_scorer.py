@@ -0,0 +1,171 @@
+# backend/embedding_scorer.py
+import hashlib
+import importlib.util
+import os
+import re
+import threading
+
+import numpy as np
+
+from backend.file_lock import file_lock
+
+DEFAULT_MODEL = os.environ.get("RESUME_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+DEFAULT_CACHE_DIR = os.path.join("data", "embeddings")
+BATCH_SIZE = 32
+
+_model_lock = threading.Lock()
+_models = {}
+_caches = {}
+
+
+def embeddings_installed():
+    """Cheap check (no model load) for the optional sentence-transformers dependency."""
+    return importlib.util.find_spec("sentence_transformers") is not None
+
+
+def get_model(model_name=DEFAULT_MODEL):
+    """
+    Load the sentence-transformers model once per process, on CPU, from local files only.
+    Returns None when the package or the model is not available.
+    """
+    with _model_lock:
+        if model_name in _models:
+            return _models[model_name]
+        model = None
+        if embeddings_installed():
+            try:
+                from sentence_transformers import SentenceTransformer
+                if os.path.isdir(model_name):
+                    model = SentenceTransformer(model_name, device="cpu")
+                else:
+                    model = SentenceTransformer(model_name, device="cpu", local_files_only=True)
+            except Exception:
+                model = None
+        _models[model_name] = model
+        return model
+
+
+def content_key(text, model_name=DEFAULT_MODEL):
+    return hashlib.sha256(f"{model_name}\0{text or ''}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding store: a raw float32 file of rows, read through a memory map,
+    plus an append-only id file whose line number is the row of each content hash.
+    Writers (the app, the API and the CLI may all embed) append under a file lock,
+    vectors before ids. Rows or a partial id line left behind by a crash between
+    the two writes are cut off by the next writer, so rows and ids stay aligned.
+    """
+
+    def __init__(self, folder, dim):
+        self.folder = folder
+        self.dim = dim
+        self.vectors_path = os.path.join(folder, "vectors.f32")
+        self.ids_path = os.path.join(folder, "ids.txt")
+        self.lock_path = os.path.join(folder, "ids.txt.lock")
+        self._lock = threading.Lock()
+        self._ids_offset = 0
+        self._row_of = {}
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        os.makedirs(folder, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """Read only the ids appended since the last load and remap the vector file."""
+        if not os.path.exists(self.ids_path) or not os.path.exists(self.vectors_path):
+            return
+        with open(self.ids_path, "rb") as f:
+            f.seek(self._ids_offset)
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            self._row_of.setdefault(line.decode("ascii"), len(self._row_of))
+        self._ids_offset += end
+        n = len(self._row_of)
+        if n != len(self._matrix):
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(n, self.dim))
+
+    def get(self, keys):
+        """Return {key: vector} for the keys already cached (also picks up rows added by other sessions)."""
+        with self._lock:
+            if any(k not in self._row_of for k in keys):
+                self._load()
+            return {k: self._matrix[self._row_of[k]] for k in keys if k in self._row_of}
+
+    def put(self, keys, vectors):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock, file_lock(self.lock_path):
+            self._load()
+            fresh = [i for i, k in enumerate(keys) if k not in self._row_of]
+            if not fresh:
+                return
+            self._truncate_to_ids()
+            with open(self.vectors_path, "ab") as f:
+                f.write(vectors[fresh].tobytes())
+            with open(self.ids_path, "a", encoding="utf-8") as f:
+                f.write("".join(keys[i] + "\n" for i in fresh))
+            self._load()
+
+    def _truncate_to_ids(self):
+        """Drop vector rows and a partial id line with no counterpart (call under the file lock)."""
+        row_bytes = len(self._row_of) * self.dim * 4
+        for path, size in ((self.vectors_path, row_bytes), (self.ids_path, self._ids_offset)):
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+
+def _get_cache(model_name, dim, cache_dir):
+    folder = os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name))
+    with _model_lock:
+        cache = _caches.get(folder)
+        if cache is None:
+            cache = _caches[folder] = EmbeddingCache(folder, dim)
+        return cache
+
+
+def embed_texts(texts, model_name=DEFAULT_MODEL, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    L2-normalised embeddings (N x dim) for texts, or None if no model is available.
+    Only texts whose content hash is not cached yet are encoded, in CPU batches.
+    """
+    model = get_model(model_name)
+    if model is None:
+        return None
+
+    cache = _get_cache(model_name, model.get_sentence_embedding_dimension(), cache_dir)
+    keys = [content_key(t, model_name) for t in texts]
+    found = cache.get(keys)
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found and key not in missing:
+            missing[key] = text or ""
+    if missing:
+        new_keys = list(missing)
+        vectors = model.encode(
+            [missing[k] for k in new_keys],
+            batch_size=BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        cache.put(new_keys, vectors)
+        found.update(zip(new_keys, np.asarray(vectors, dtype=np.float32)))
+
+    return np.vstack([found[k] for k in keys]) if keys else np.zeros((0, cache.dim), dtype=np.float32)
+
+
+def embedding_scores(resume_texts, jd_text, model_name=DEFAULT_MODEL, cache_dir=DEFAULT_CACHE_DIR):
+    """Cosine similarity (0-100) of each resume to the JD, or None when embeddings are unavailable."""
+    vectors = embed_texts(list(resume_texts) + [jd_text or ""], model_name, cache_dir)
+    if vectors is None:
+        return None
+    sims = vectors[:-1] @ vectors[-1]
+    return [round(100 * float(max(s, 0.0)), 2) for s in sims]
+
+
+def embedding_score(resume_text, jd_text, model_name=DEFAULT_MODEL, cache_dir=DEFAULT_CACHE_DIR):
+    scores = embedding_scores([resume_text], jd_text, model_name, cache_dir)
+    return scores[0] if scores is not None else None
@@ -0,0 +1,190 @@
+# backend/import_profile.py
+"""
+Where start-up time goes.
+
+Cold start: each Streamlit entry point's top-level imports are run in a fresh
+interpreter under -X importtime.
+
+    python -m backend.import_profile                      # app.py and pages/*.py
+    python -m backend.import_profile --budget-ms 1500     # exit 1 if an entry point is over budget
+
+Per rerun: with RESUME_IMPORT_PROFILE=1 the app wraps __import__ and lists, in
+the sidebar, every import that loaded new modules during the latest rerun
+(lazy imports show up the first time their code path runs).
+"""
+import argparse
+import ast
+import builtins
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+ENABLED = os.environ.get("RESUME_IMPORT_PROFILE", "").lower() in ("1", "true", "yes", "on")
+
+_events = []  # (importing module, imported name, ms, modules loaded)
+_events_lock = threading.Lock()
+_state = threading.local()
+_original_import = None
+
+
+# ----- per-rerun tracking (inside the app) -----
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if getattr(_state, "active", False):
+        return _original_import(name, globals, locals, fromlist, level)
+    before = len(sys.modules)
+    _state.active = True
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _state.active = False
+        loaded = len(sys.modules) - before
+        if loaded > 0:
+            importer = (globals or {}).get("__name__", "?")
+            event = (importer, name or ".".join(fromlist or ()), round((time.perf_counter() - start) * 1000, 1), loaded)
+            with _events_lock:
+                _events.append(event)
+
+
+def install():
+    """Start recording imports that load new modules (no-op unless RESUME_IMPORT_PROFILE is set)."""
+    global _original_import
+    if not ENABLED or _original_import is not None:
+        return
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+
+
+def mark():
+    """Position in the event list; pass it to events_since() to see what a rerun imported."""
+    with _events_lock:
+        return len(_events)
+
+
+def events_since(position=0):
+    with _events_lock:
+        return [
+            {"imported_by": importer, "module": name, "ms": ms, "modules_loaded": loaded}
+            for importer, name, ms, loaded in _events[position:]
+        ]
+
+
+# ----- cold start (fresh interpreter) -----
+def entry_imports(script_path):
+    """Source of the module-level import statements of a script, in order."""
+    with open(script_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, filename=script_path)
+    return [
+        ast.get_source_segment(source, node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+
+
+_COLD_START = """
+import json, sys, time
+code = sys.argv[1]
+preloaded = sorted(sys.modules)
+start = time.perf_counter()
+exec(code, {"__name__": "__profiled__"})
+cold = time.perf_counter() - start
+start = time.perf_counter()
+exec(code, {"__name__": "__profiled__"})
+warm = time.perf_counter() - start
+print(json.dumps({"cold_ms": cold * 1000, "rerun_ms": warm * 1000, "preloaded": preloaded}))
+"""
+
+
+def _parse_importtime(stderr):
+    """[(depth, name, self_us, cumulative_us)] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # the header line
+        name = fields[2]
+        depth = (len(name) - len(name.lstrip()) - 1) // 2  # two spaces per nesting level
+        rows.append((depth, name.strip(), self_us, cumulative))
+    return rows
+
+
+def profile_entry_point(script_path, top=10, cwd=None):
+    """Cold-start and rerun import cost of one entry point, with its heaviest imports."""
+    code = "\n".join(entry_imports(script_path))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _COLD_START, code],
+        capture_output=True, text=True, cwd=cwd or os.getcwd(),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{script_path}: importing failed\n{proc.stderr.strip().splitlines()[-1:]}")
+    timing = json.loads(proc.stdout.strip().splitlines()[-1])
+    preloaded = set(timing["preloaded"])  # interpreter start-up and this harness, not the entry point
+    rows = [r for r in _parse_importtime(proc.stderr) if r[1] not in preloaded]
+
+    by_package = {}
+    for _, name, self_us, _ in rows:
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+    direct = sorted(((name, cum) for depth, name, _, cum in rows if depth == 0), key=lambda r: -r[1])
+    return {
+        "entry_point": script_path,
+        "cold_ms": round(timing["cold_ms"], 1),
+        "rerun_ms": round(timing["rerun_ms"], 3),
+        "modules": len(rows),
+        "direct_imports": [{"module": n, "ms": round(us / 1000, 1)} for n, us in direct[:top]],
+        "packages": [
+            {"package": p, "self_ms": round(us / 1000, 1)}
+            for p, us in sorted(by_package.items(), key=lambda r: -r[1])[:top]
+        ],
+    }
+
+
+def print_profile(result):
+    print(f"{result['entry_point']}: cold {result['cold_ms']} ms ({result['modules']} modules), "
+          f"rerun {result['rerun_ms']} ms")
+    print(f"  {'direct import':<40}{'cumulative ms':>14}")
+    for row in result["direct_imports"]:
+        print(f"  {row['module']:<40}{row['ms']:>14}")
+    print(f"  {'package':<40}{'self ms':>14}")
+    for row in result["packages"]:
+        print(f"  {row['package']:<40}{row['self_ms']:>14}")
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import cost of the Streamlit entry points.")
+    parser.add_argument("scripts", nargs="*", help="entry point scripts (default: app.py and pages/*.py)")
+    parser.add_argument("--top", type=int, default=10, help="heaviest imports / packages to list")
+    parser.add_argument("--budget-ms", type=float, help="fail when an entry point's cold import time exceeds this")
+    parser.add_argument("--json", dest="json_out", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    scripts = args.scripts or ["app.py"] + sorted(glob.glob(os.path.join("pages", "*.py")))
+    results = [profile_entry_point(s, args.top) for s in scripts]
+    for result in results:
+        print_profile(result)
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.budget_ms is not None:
+        over = [r for r in results if r["cold_ms"] > args.budget_ms]
+        for r in over:
+            print(f"OVER BUDGET {r['entry_point']}: {r['cold_ms']} ms > {args.budget_ms} ms")
+        return 1 if over else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
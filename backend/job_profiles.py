@@ -0,0 +1,178 @@
+# backend/job_profiles.py
+
+# ========= PREDEFINED ROLES, JDs & SKILLS ========= #
+
+JOB_PROFILES = {
+    "Software Engineer": {
+        "jd": """We are looking for a Software Engineer responsible for designing, developing, 
+and maintaining high-quality applications. You will work with cross-functional teams, 
+write clean and scalable code, perform code reviews, and contribute to the full SDLC.""",
+        "skills": [
+            "Python", "Java", "C++", "Data Structures", "Algorithms", "Object Oriented Programming",
+            "Git", "REST APIs", "SQL", "Unit Testing", "Agile", "Debugging"
+        ],
+    },
+    "Full Stack Developer": {
+        "jd": """As a Full Stack Developer you will build end-to-end web applications, 
+work on both frontend and backend, integrate APIs, and ensure good performance and security.""",
+        "skills": [
+            "HTML", "CSS", "JavaScript", "React", "Node.js", "Express", "REST APIs",
+            "MongoDB", "SQL", "Git", "Responsive Design", "Authentication"
+        ],
+    },
+    "Frontend Developer": {
+        "jd": """We need a Frontend Developer to create responsive, user-friendly interfaces, 
+optimize web pages for speed, and collaborate with designers and backend engineers.""",
+        "skills": [
+            "HTML", "CSS", "JavaScript", "React", "Redux",
+            "Responsive Design", "Cross-Browser Compatibility", "Figma", "UI Development"
+        ],
+    },
+    "Backend Developer": {
+        "jd": """Backend Developer will design scalable APIs, manage databases, 
+implement business logic, and ensure performance and security on the server side.""",
+        "skills": [
+            "Python", "Django", "Flask", "Node.js", "REST APIs", "SQL",
+            "PostgreSQL", "MySQL", "Database Design", "Authentication", "Docker"
+        ],
+    },
+    "Data Scientist": {
+        "jd": """Data Scientist will build models, analyze large datasets, 
+generate insights, and help business stakeholders make data-driven decisions.""",
+        "skills": [
+            "Python", "R", "Statistics", "Machine Learning", "Pandas", "NumPy",
+            "Scikit-learn", "Data Visualization", "SQL", "Feature Engineering"
+        ],
+    },
+    "Data Analyst": {
+        "jd": """Data Analyst will clean and analyze data, build dashboards, 
+prepare reports, and support decision-making with data insights.""",
+        "skills": [
+            "Excel", "SQL", "Power BI", "Tableau", "Data Cleaning", "Data Visualization",
+            "Reporting", "Pivot Tables", "Basic Statistics"
+        ],
+    },
+    "Machine Learning Engineer": {
+        "jd": """ML Engineer will design, build, and deploy machine learning models into production, 
+optimize performance, and collaborate with data scientists and engineers.""",
+        "skills": [
+            "Python", "Scikit-learn", "TensorFlow", "PyTorch", "Machine Learning",
+            "Model Deployment", "MLOps", "Docker", "APIs", "Data Pipelines"
+        ],
+    },
+    "DevOps Engineer": {
+        "jd": """DevOps Engineer will manage CI/CD pipelines, automate deployments, 
+monitor systems, and ensure reliability and scalability of infrastructure.""",
+        "skills": [
+            "Linux", "Bash", "CI/CD", "Jenkins", "Docker", "Kubernetes",
+            "AWS", "Azure", "Monitoring", "Git", "Terraform"
+        ],
+    },
+    "Cloud Engineer": {
+        "jd": """Cloud Engineer will design, deploy, and manage cloud infrastructure, 
+ensure security and cost optimization, and support development teams.""",
+        "skills": [
+            "AWS", "Azure", "GCP", "Virtual Machines", "VPC", "Cloud Security",
+            "IAM", "Docker", "Kubernetes", "Networking", "Monitoring"
+        ],
+    },
+    "Product Manager": {
+        "jd": """Product Manager will own product roadmap, gather requirements, 
+work with cross-functional teams, and ensure successful product delivery and adoption.""",
+        "skills": [
+            "Product Roadmap", "User Stories", "Stakeholder Management",
+            "Market Research", "Wireframing", "Analytics", "Agile", "Prioritization"
+        ],
+    },
+    "Project Manager": {
+        "jd": """Project Manager will plan, execute, and close projects, 
+manage timelines, resources, risks, and communicate with stakeholders.""",
+        "skills": [
+            "Project Planning", "Scheduling", "Risk Management", "Stakeholder Management",
+            "MS Project", "JIRA", "Agile", "Scrum", "Communication"
+        ],
+    },
+    "Business Analyst": {
+        "jd": """Business Analyst will gather requirements, map processes, 
+analyze business problems, and propose data-driven solutions.""",
+        "skills": [
+            "Requirements Gathering", "Process Mapping", "SQL", "Documentation",
+            "Stakeholder Communication", "UML", "User Stories", "Gap Analysis"
+        ],
+    },
+    "Sales Executive": {
+        "jd": """Sales Executive will identify leads, pitch products, 
+follow up with clients, and close deals to achieve revenue targets.""",
+        "skills": [
+            "Lead Generation", "Cold Calling", "Negotiation", "CRM", "Customer Relationship",
+            "Sales Pitch", "Objection Handling", "Closing Deals", "Communication"
+        ],
+    },
+    "Sales Manager": {
+        "jd": """Sales Manager will manage sales team, define targets, monitor performance, 
+and drive strategies to increase revenue and market share.""",
+        "skills": [
+            "Sales Strategy", "Team Management", "Pipeline Management", "CRM",
+            "Forecasting", "Negotiation", "Target Setting", "Coaching", "Reporting"
+        ],
+    },
+    "Inside Sales Representative": {
+        "jd": """Inside Sales Representative will handle inbound and outbound calls, 
+qualify leads, nurture prospects, and schedule demos/meetings.""",
+        "skills": [
+            "CRM", "Cold Calling", "Lead Qualification", "Email Outreach",
+            "Communication", "Objection Handling", "Follow-ups"
+        ],
+    },
+    "Digital Marketing Specialist": {
+        "jd": """Digital Marketing Specialist will plan and execute online campaigns, 
+optimize SEO/SEM, manage social media, and track performance metrics.""",
+        "skills": [
+            "SEO", "SEM", "Google Ads", "Facebook Ads", "Content Marketing",
+            "Email Marketing", "Google Analytics", "Social Media Management"
+        ],
+    },
+    "HR Manager": {
+        "jd": """HR Manager will handle recruitment, employee engagement, performance management, 
+and ensure HR policies and compliance.""",
+        "skills": [
+            "Recruitment", "Interviewing", "Onboarding", "Performance Management",
+            "Employee Engagement", "HR Policies", "Conflict Resolution"
+        ],
+    },
+    "UI/UX Designer": {
+        "jd": """UI/UX Designer will create user-centered designs, wireframes, prototypes, 
+and collaborate with engineers to implement intuitive interfaces.""",
+        "skills": [
+            "Figma", "Wireframing", "Prototyping", "User Research",
+            "Usability Testing", "UI Design", "Design Systems"
+        ],
+    },
+    "QA Engineer": {
+        "jd": """QA Engineer will design and execute test plans, write test cases, 
+and ensure product quality through manual and automated testing.""",
+        "skills": [
+            "Test Cases", "Test Planning", "Manual Testing", "Automation Testing",
+            "Selenium", "Bug Tracking", "JIRA", "Regression Testing"
+        ],
+    },
+    "Customer Support Specialist": {
+        "jd": """Customer Support Specialist will resolve customer queries, troubleshoot issues, 
+and ensure high customer satisfaction through timely support.""",
+        "skills": [
+            "Customer Support", "Ticketing Systems", "Communication",
+            "Problem Solving", "Email Support", "Chat Support", "Phone Support"
+        ],
+    },
+    "Financial Analyst": {
+        "jd": """Financial Analyst will analyze financial data, create reports, 
+build models, and support budgeting and forecasting.""",
+        "skills": [
+            "Financial Modeling", "Excel", "Forecasting", "Budgeting",
+            "Reporting", "Power BI", "Variance Analysis"
+        ],
+    },
+}
+
+# Union of all skills (to detect skills present in resume)
+ALL_SKILLS = sorted({skill for v in JOB_PROFILES.values() for skill in v["skills"]})
@@ -0,0 +1,141 @@
+# backend/job_queue.py
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_WORKERS = 4          # analyses running at once; CPU-heavy parts go to the process pool
+MAX_FINISHED_JOBS = 200  # finished jobs kept for result retrieval, oldest dropped first
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+class Job:
+    """
+    One background job. The job function receives the Job and reports progress
+    through update(); readers take a consistent copy with snapshot().
+    """
+
+    def __init__(self, kind, label, stages):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.label = label
+        self.stages = list(stages)
+        self.status = "queued"  # queued -> running -> done | failed | cancelled
+        self.stage = None
+        self.stage_progress = 0.0
+        self.message = ""
+        self.partial = None     # optional live result, e.g. rows of a running batch
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def update(self, stage, progress=0.0, message="", partial=None):
+        with self._lock:
+            self.stage = stage
+            self.stage_progress = min(max(progress, 0.0), 1.0)
+            self.message = message
+            if partial is not None:
+                self.partial = partial
+
+    def _progress(self):
+        if self.status == "done":
+            return 1.0
+        if self.stage not in self.stages:
+            return 0.0
+        return (self.stages.index(self.stage) + self.stage_progress) / len(self.stages)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "label": self.label,
+                "status": self.status,
+                "stage": self.stage,
+                "message": self.message,
+                "progress": self._progress(),
+                "partial": self.partial,
+                "result": self.result,
+                "error": self.error,
+                "created": self.created,
+                "started": self.started,
+                "finished": self.finished,
+            }
+
+
+class JobQueue:
+    """Runs submitted jobs on a small thread pool and keeps them addressable by id."""
+
+    def __init__(self, max_workers=JOB_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()  # job id -> Job
+        self._futures = {}
+
+    def submit(self, kind, label, stages, fn, *args, **kwargs):
+        """Queue fn(job, *args, **kwargs); returns the job id."""
+        job = Job(kind, label, stages)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def _run(self, job, fn, args, kwargs):
+        with job._lock:
+            job.status = "running"
+            job.started = time.time()
+        try:
+            result = fn(job, *args, **kwargs)
+        except Exception as e:
+            with job._lock:
+                job.status = "failed"
+                job.error = str(e) or e.__class__.__name__
+                job.finished = time.time()
+        else:
+            with job._lock:
+                job.status = "done"
+                job.result = result
+                job.finished = time.time()
+        finally:
+            with self._lock:
+                self._futures.pop(job.id, None)
+            self._evict()
+
+    def _evict(self):
+        with self._lock:
+            finished = [jid for jid, j in self._jobs.items() if j.status in ("done", "failed", "cancelled")]
+            for jid in finished[:max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+                del self._jobs[jid]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Cancel a job that has not started yet. Returns True if it was cancelled."""
+        with self._lock:
+            future = self._futures.get(job_id)
+            job = self._jobs.get(job_id)
+        if future is None or job is None or not future.cancel():
+            return False
+        with job._lock:
+            job.status = "cancelled"
+            job.finished = time.time()
+        with self._lock:
+            self._futures.pop(job_id, None)
+        return True
+
+
+def get_job_queue():
+    """The process-wide job queue, shared by every session of the app."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue()
+        return _queue
@@ -0,0 +1,196 @@
+# backend/parse_cache.py
+import base64
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.path.join("data", "parse_cache")
+DEFAULT_MAX_ITEMS = 256
+DEFAULT_MAX_DISK_ITEMS = int(os.environ.get("RESUME_PARSE_CACHE_MAX_FILES", "5000") or 0)
+# RESUME_PARSE_CACHE_DISK=0 keeps the cache in memory only (batch_shortlist sets it
+# for its one-off runs, which would otherwise leave a JSON file per resume behind)
+DISK_ENABLED = os.environ.get("RESUME_PARSE_CACHE_DISK", "1").lower() not in ("0", "false", "no", "off")
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parsed resumes, keyed by the SHA-256 of the file bytes.
+
+    Two tiers: a bounded in-memory LRU, and a directory of JSON files holding the
+    extracted text and image bytes, so other sessions and restarts skip parsing too.
+    The directory is an LRU as well: a hit refreshes the file's mtime, and every
+    max_disk_items // 10 writes the oldest files beyond max_disk_items are deleted.
+    """
+
+    def __init__(self, folder=DEFAULT_CACHE_DIR, max_items=DEFAULT_MAX_ITEMS,
+                 max_disk_items=DEFAULT_MAX_DISK_ITEMS, disk=True):
+        self.folder = folder
+        self.max_items = max_items
+        self.max_disk_items = max_disk_items
+        self.disk = disk and max_disk_items > 0
+        self._prune_every = max(1, max_disk_items // 10)
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(file_bytes, namespace=""):
+        digest = hashlib.sha256(file_bytes or b"").hexdigest()
+        return f"{namespace}-{digest}" if namespace else digest
+
+    def _disk_path(self, key):
+        return os.path.join(self.folder, key[-2:], key + ".json")
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return (text, image_bytes) or None."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if not self.disk:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            path = self._disk_path(key)
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            os.utime(path)
+            image = base64.b64decode(saved["image"]) if saved.get("image") else None
+            value = (saved.get("text") or "", image)
+        except Exception:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        self._remember(key, value)
+        with self._lock:
+            self.disk_hits += 1
+        return value
+
+    def put(self, key, text, image_bytes=None):
+        value = (text or "", image_bytes)
+        self._remember(key, value)
+        if not self.disk:
+            return
+
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            payload = {
+                "text": value[0],
+                "image": base64.b64encode(image_bytes).decode("ascii") if image_bytes else None,
+            }
+            # write to a temp file first so readers never see a half-written entry
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except Exception:
+            return  # the disk tier is best effort; the memory tier still has it
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self._prune_every == 0
+        if prune:
+            self.prune()
+
+    def get_or_parse(self, file_bytes, namespace, parse_fn):
+        """
+        Return cached (text, image_bytes) for these bytes, calling parse_fn() only on a miss.
+        parse_fn may return a third item, complete; incomplete results are not cached.
+        """
+        key = self.key_for(file_bytes, namespace)
+        value = self.get(key)
+        if value is None:
+            result = parse_fn()
+            text, image_bytes = result[0], result[1]
+            if len(result) < 3 or result[2]:
+                self.put(key, text, image_bytes)
+            value = (text or "", image_bytes)
+        return value
+
+    def _disk_entries(self):
+        """(mtime, path) of every disk entry, most recently used first."""
+        entries = []
+        for path in glob.glob(os.path.join(self.folder, "*", "*.json")):
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        return entries
+
+    def prune(self):
+        """Delete the least recently used disk entries beyond max_disk_items; returns how many."""
+        removed = 0
+        for _, path in self._disk_entries()[self.max_disk_items:]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass  # another process pruned it first
+        return removed
+
+    def disk_items(self):
+        return len(glob.glob(os.path.join(self.folder, "*", "*.json"))) if self.disk else 0
+
+    def items(self, limit=None):
+        """Yield (key, text) for the disk entries with text, most recently used first."""
+        if not self.disk:
+            return
+        for _, path in self._disk_entries()[:limit]:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = json.load(f).get("text")
+            except (OSError, ValueError):
+                continue
+            if text:
+                yield os.path.basename(path)[:-len(".json")], text
+
+    def texts(self, limit=None):
+        """Distinct extracted texts from the disk tier, most recently used first (the resumes parsed so far)."""
+        return list(dict.fromkeys(text for _, text in self.items(limit)))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_items": len(self._memory),
+            }
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_parse_cache():
+    """Process-wide ParseCache shared by every Streamlit session."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ParseCache(disk=DISK_ENABLED)
+        return _default_cache
@@ -0,0 +1,109 @@
+# backend/pdf_backends.py
+import importlib.util
+import os
+from functools import lru_cache
+
+# Deployment-wide choice; any name from available_backends() works
+DEFAULT_PDF_BACKEND = os.environ.get("RESUME_PDF_BACKEND", "pypdf2")
+
+_BACKENDS = {}
+
+
+def register_backend(name, module):
+    """Register a page-text generator under name; it is only offered if module is installed."""
+    def wrap(fn):
+        _BACKENDS[name] = (module, fn)
+        return fn
+    return wrap
+
+
+@lru_cache(maxsize=None)
+def _installed(module):
+    # find_spec searches sys.path; resolve_backend runs on every parse, even cache hits,
+    # and packages are not installed or removed under a running process
+    return importlib.util.find_spec(module) is not None
+
+
+def available_backends():
+    return [name for name, (module, _) in _BACKENDS.items() if _installed(module)]
+
+
+def resolve_backend(name=None):
+    """
+    Registered name of the backend get_backend(name) uses (default: RESUME_PDF_BACKEND,
+    else PyPDF2), falling back to the first installed one if it is missing.
+    """
+    name = (name or DEFAULT_PDF_BACKEND).strip().lower()
+    installed = available_backends()
+    if name not in installed:
+        if not installed:
+            raise RuntimeError("No PDF text backend is installed (pip install PyPDF2).")
+        name = installed[0]
+    return name
+
+
+def get_backend(name=None):
+    """Page-text generator for name (see resolve_backend)."""
+    return _BACKENDS[resolve_backend(name)][1]
+
+
+# Each backend takes a path or binary file object and lazily yields one string
+# per page ("" when a page has no text or fails to extract).
+
+@register_backend("pypdf2", "PyPDF2")
+def _pypdf2_pages(source):
+    from PyPDF2 import PdfReader
+    for page in PdfReader(source).pages:
+        try:
+            yield page.extract_text() or ""
+        except Exception:
+            yield ""
+
+
+@register_backend("pypdf", "pypdf")
+def _pypdf_pages(source):
+    from pypdf import PdfReader
+    for page in PdfReader(source).pages:
+        try:
+            yield page.extract_text() or ""
+        except Exception:
+            yield ""
+
+
+@register_backend("pdfplumber", "pdfplumber")
+def _pdfplumber_pages(source):
+    import pdfplumber
+    with pdfplumber.open(source) as pdf:
+        for page in pdf.pages:
+            try:
+                yield page.extract_text() or ""
+            except Exception:
+                yield ""
+            finally:
+                page.flush_cache()
+
+
+@register_backend("pymupdf", "fitz")
+def _pymupdf_pages(source):
+    import fitz
+    if isinstance(source, str):
+        doc = fitz.open(source)
+    else:
+        doc = fitz.open(stream=source.read(), filetype="pdf")
+    with doc:
+        for page in doc:
+            try:
+                yield page.get_text() or ""
+            except Exception:
+                yield ""
+
+
+@register_backend("pdfminer", "pdfminer")
+def _pdfminer_pages(source):
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    for layout in extract_pages(source):
+        try:
+            yield "".join(el.get_text() for el in layout if isinstance(el, LTTextContainer))
+        except Exception:
+            yield ""
@@ -0,0 +1,137 @@
+# backend/pdf_benchmark.py
+"""
+Compare the installed PDF text backends on a corpus of resumes.
+
+    python -m backend.pdf_benchmark                 # every PDF in uploads/
+    python -m backend.pdf_benchmark a.pdf dir/ --repeat 3 --json out.json
+
+For each backend it reports pages/sec, peak Python heap during extraction
+(tracemalloc) and skill recall: the share of catalog skills found by any
+backend in a file that this backend's text also yields.
+"""
+import argparse
+import glob
+import io
+import json
+import os
+import time
+import tracemalloc
+
+from backend.job_profiles import ALL_SKILLS
+from backend.pdf_backends import available_backends, get_backend
+from backend.skill_catalog import get_skill_matcher
+
+
+def collect_pdfs(paths):
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            files.extend(sorted(glob.glob(os.path.join(p, "**", "*.pdf"), recursive=True)))
+        elif p.lower().endswith(".pdf"):
+            files.append(p)
+    return files
+
+
+def run_backend(name, corpus, repeat=1):
+    """Extract every file `repeat` times; return timing, memory and per-file skills."""
+    pages_fn = get_backend(name)
+    matcher = get_skill_matcher(ALL_SKILLS)
+    pages = 0
+    elapsed = 0.0
+    peak = 0
+    skills = {}
+    errors = 0
+
+    for path, data in corpus.items():
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                texts = list(pages_fn(io.BytesIO(data)))
+            except Exception:
+                texts = None
+            elapsed += time.perf_counter() - start
+
+        # separate pass for memory, tracemalloc would distort the timings
+        tracemalloc.start()
+        try:
+            list(pages_fn(io.BytesIO(data)))
+        except Exception:
+            pass
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        if texts is None:
+            errors += 1
+            skills[path] = set()
+            continue
+        pages += len(texts) * repeat
+        skills[path] = set(matcher.match_indices("\n".join(texts)))
+
+    return {
+        "backend": name,
+        "files": len(corpus),
+        "errors": errors,
+        "pages": pages,
+        "seconds": round(elapsed, 4),
+        "pages_per_sec": round(pages / elapsed, 2) if elapsed else 0.0,
+        "peak_mem_mb": round(peak / (1024 * 1024), 2),
+        "skills": skills,
+    }
+
+
+def benchmark(paths, backends=None, repeat=1):
+    corpus = {}
+    for path in collect_pdfs(paths):
+        with open(path, "rb") as f:
+            corpus[path] = f.read()
+    names = backends or available_backends()
+    runs = [run_backend(name, corpus, repeat) for name in names]
+
+    # reference per file = union of skills any backend found
+    reference = {path: set().union(*(r["skills"][path] for r in runs)) for path in corpus}
+    total_ref = sum(len(s) for s in reference.values())
+    results = []
+    for r in runs:
+        found = sum(len(r["skills"][p] & reference[p]) for p in corpus)
+        lost = sorted({ALL_SKILLS[i] for p in corpus for i in reference[p] - r["skills"][p]})
+        row = {k: v for k, v in r.items() if k != "skills"}
+        row["skill_recall"] = round(found / total_ref, 4) if total_ref else 1.0
+        row["missed_skills"] = lost
+        results.append(row)
+    return results
+
+
+def print_table(results):
+    header = f"{'backend':<12}{'files':>6}{'errors':>7}{'pages':>7}{'pages/sec':>11}{'peak MB':>9}{'recall':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['backend']:<12}{r['files']:>6}{r['errors']:>7}{r['pages']:>7}"
+            f"{r['pages_per_sec']:>11}{r['peak_mem_mb']:>9}{r['skill_recall']:>8}"
+        )
+        if r["missed_skills"]:
+            print(f"{'':<12}missed: {', '.join(r['missed_skills'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF text backends on sample resumes.")
+    parser.add_argument("paths", nargs="*", default=["uploads"], help="PDF files or folders (default: uploads/)")
+    parser.add_argument("--backend", action="append", help="only run this backend (repeatable)")
+    parser.add_argument("--repeat", type=int, default=1, help="extract each file this many times")
+    parser.add_argument("--json", dest="json_out", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.paths, args.backend, max(1, args.repeat))
+    if not results or not results[0]["files"]:
+        print("No PDF files found.")
+        return 1
+    print_table(results)
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+# backend/results_archive.py
+"""
+Columnar archive of analysis history: Parquet files partitioned by month of
+analysis (data/archive/month=YYYY-MM/part-<id>.parquet). job_title and the skill
+lists are dictionary-encoded, so repeated titles/skills are stored once per file.
+
+The JSON-Lines log stays the write path; results_db.compact() periodically
+moves it into the archive. The archive is the compact cold copy of the
+history: the dashboard and exports query results.db, and the archive is only
+read back (iter_archive) to rebuild that database.
+"""
+import glob
+import json
+import os
+import shutil
+from datetime import datetime
+
+from backend.results_store import DATA_DIR
+
+ARCHIVE_DIR = os.path.join(DATA_DIR, "archive")
+UNKNOWN_MONTH = "unknown"
+
+LIST_COLUMNS = ("jd_skills", "resume_skills", "missing_skills")
+COLUMNS = ("timestamp", "candidate_name", "job_title", "score") + LIST_COLUMNS + ("extra",)
+
+
+def archive_installed():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def has_archive(archive_dir=ARCHIVE_DIR):
+    return bool(glob.glob(os.path.join(archive_dir, "month=*", "*.parquet")))
+
+
+def archive_schema():
+    import pyarrow as pa
+
+    skills = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+    return pa.schema([
+        ("timestamp", pa.timestamp("us")),
+        ("candidate_name", pa.string()),
+        ("job_title", pa.dictionary(pa.int32(), pa.string())),
+        ("score", pa.float64()),
+        ("jd_skills", skills),
+        ("resume_skills", skills),
+        ("missing_skills", skills),
+        ("extra", pa.string()),  # JSON of every other field (and values the typed columns can't hold)
+    ])
+
+
+def _split(record):
+    """Typed column values for one record; anything that doesn't fit goes to extra."""
+    extra = {k: v for k, v in record.items() if k not in COLUMNS}
+    ts = record.get("timestamp")
+    parsed = None
+    if isinstance(ts, str):
+        try:
+            parsed = datetime.fromisoformat(ts)
+        except ValueError:
+            pass
+    if ts is not None and (parsed is None or parsed.isoformat() != ts or parsed.tzinfo is not None):
+        extra["timestamp"] = ts
+        parsed = None
+
+    score = record.get("score")
+    if score is not None and (isinstance(score, bool) or not isinstance(score, (int, float))):
+        extra["score"] = score
+        score = None
+
+    row = {
+        "timestamp": parsed,
+        "candidate_name": record.get("candidate_name") if isinstance(record.get("candidate_name"), str) else None,
+        "job_title": record.get("job_title") if isinstance(record.get("job_title"), str) else None,
+        "score": float(score) if score is not None else None,
+    }
+    for k in ("candidate_name", "job_title"):
+        if record.get(k) is not None and row[k] is None:
+            extra[k] = record[k]
+    for k in LIST_COLUMNS:
+        values = record.get(k)
+        row[k] = [s for s in values if isinstance(s, str)] if isinstance(values, list) else None
+        if values is not None and (row[k] is None or len(row[k]) != len(values)):
+            extra[k] = values
+    row["extra"] = json.dumps(extra, ensure_ascii=False) if extra else None
+    return row
+
+
+def _to_table(rows):
+    import pyarrow as pa
+
+    schema = archive_schema()
+    arrays = []
+    for field in schema:
+        values = [r[field.name] for r in rows]
+        if field.name in LIST_COLUMNS:
+            plain = pa.array(values, type=pa.list_(pa.string()))
+            arrays.append(pa.ListArray.from_arrays(
+                plain.offsets, plain.values.dictionary_encode(), mask=plain.is_null()
+            ).cast(field.type))
+        elif field.name == "job_title":
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def records_to_table(records):
+    """Arrow table (archive schema) for a list of result records."""
+    return _to_table([_split(r) for r in records])
+
+
+def write_records(records, part_id, archive_dir=ARCHIVE_DIR):
+    """
+    Write records into one part file per month partition. part_id names the files,
+    so writing the same batch again replaces its parts instead of duplicating them.
+    Returns the number of records written.
+    """
+    import pyarrow.parquet as pq
+
+    by_month = {}
+    for record in records:
+        row = _split(record)
+        month = row["timestamp"].strftime("%Y-%m") if row["timestamp"] else UNKNOWN_MONTH
+        by_month.setdefault(month, []).append(row)
+
+    for month, rows in by_month.items():
+        folder = os.path.join(archive_dir, f"month={month}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"part-{part_id}.parquet")
+        tmp = path + ".tmp"
+        pq.write_table(_to_table(rows), tmp, compression="zstd")
+        os.replace(tmp, path)
+    return sum(len(rows) for rows in by_month.values())
+
+
+def _dataset(archive_dir):
+    import pyarrow.dataset as ds
+
+    return ds.dataset(
+        archive_dir, format="parquet", partitioning="hive", schema=_schema_with_month(), exclude_invalid_files=True
+    )
+
+
+def _schema_with_month():
+    import pyarrow as pa
+
+    return archive_schema().append(pa.field("month", pa.string()))
+
+
+def _records_from_batch(batch):
+    data = batch.to_pydict()
+    names = [n for n in COLUMNS if n in data]
+    for i in range(batch.num_rows):
+        record = {}
+        for name in names:
+            value = data[name][i]
+            if name == "extra":
+                if value:
+                    record.update(json.loads(value))
+            elif name == "timestamp":
+                if value is not None:
+                    record.setdefault("timestamp", value.isoformat())
+            elif value is not None:
+                record.setdefault(name, value)
+        yield record
+
+
+def iter_archive(archive_dir=ARCHIVE_DIR, batch_size=4096):
+    """Yield lists of archived records (oldest partition first), batch by batch."""
+    if not has_archive(archive_dir):
+        return
+    dataset = _dataset(archive_dir)
+    for fragment in sorted(dataset.get_fragments(), key=lambda f: f.path):
+        for batch in fragment.to_batches(columns=list(COLUMNS), batch_size=batch_size):
+            yield list(_records_from_batch(batch))
+
+
+def clear_archive(archive_dir=ARCHIVE_DIR):
+    shutil.rmtree(archive_dir, ignore_errors=True)
+
+
+def main(argv=None):
+    import argparse
+
+    from backend import results_db
+
+    parser = argparse.ArgumentParser(description="Move the results log into the Parquet archive.")
+    parser.add_argument("--min-bytes", type=int, default=0, help="only compact when the log is at least this big")
+    args = parser.parse_args(argv)
+    if not archive_installed():
+        print("pyarrow is not installed.")
+        return 1
+    moved = results_db.compact(min_bytes=args.min_bytes)
+    print(f"Archived {moved} records.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
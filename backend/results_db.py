@@ -0,0 +1,558 @@
+# backend/results_db.py
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+
+from backend import results_archive
+from backend.results_archive import ARCHIVE_DIR
+from backend.file_lock import file_lock
+from backend.results_store import DATA_DIR, RESULTS_PATH, lock_path
+
+DB_PATH = os.path.join(DATA_DIR, "results.db")
+COMPACT_MIN_BYTES = 4 * 1024 * 1024  # dashboard compacts the log into the archive past this size
+
+CORE_FIELDS = ("timestamp", "candidate_name", "job_title", "score")
+SKILL_TABLES = ("jd_skills", "resume_skills", "missing_skills")
+ROLLUP_TABLES = ("rollup_daily", "rollup_skills")
+HIST_BINS = 10
+LATENCY_SAMPLE = 5000  # latest timed analyses behind the dashboard's latency panel
+
+DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT,
+    candidate_name TEXT,
+    job_title TEXT,
+    score REAL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results(timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_job_title ON results(job_title, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_score ON results(score);
+CREATE INDEX IF NOT EXISTS idx_results_candidate ON results(candidate_name, timestamp);
+CREATE TABLE IF NOT EXISTS sync_state (
+    log_path TEXT PRIMARY KEY,
+    log_offset INTEGER NOT NULL
+);
+""" + "".join(
+    f"""
+CREATE TABLE IF NOT EXISTS {t} (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    position INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    skill_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{t}_result ON {t}(result_id);
+CREATE INDEX IF NOT EXISTS idx_{t}_skill ON {t}(skill_key);
+"""
+    for t in SKILL_TABLES
+) + """
+-- Rollups keyed by day x job_title x whole-percent score band ('' = unknown day/job,
+-- band -1 = no score), so dashboard aggregates merge buckets instead of scanning rows.
+CREATE TABLE IF NOT EXISTS rollup_daily (
+    day TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    score_band INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    score_sum REAL NOT NULL,
+    PRIMARY KEY (day, job_title, score_band)
+);
+CREATE TABLE IF NOT EXISTS rollup_skills (
+    day TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    score_band INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    matched INTEGER NOT NULL,
+    missing INTEGER NOT NULL,
+    listed_missing INTEGER NOT NULL,
+    first_listed INTEGER,
+    PRIMARY KEY (day, job_title, score_band, skill)
+);
+"""
+
+
+_initialized = set()  # database files whose schema this process has already created
+_init_lock = threading.Lock()
+
+
+def _ensure_schema(db_path):
+    """Create the schema and switch to WAL (persistent per file) once per process and path."""
+    key = os.path.abspath(db_path)
+    if key in _initialized and os.path.exists(key):
+        return
+    with _init_lock:
+        if key in _initialized and os.path.exists(key):
+            return
+        folder = os.path.dirname(key)
+        os.makedirs(folder, exist_ok=True)
+        with closing(sqlite3.connect(db_path, timeout=30, isolation_level=None)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        _initialized.add(key)
+
+
+def connect(db_path=DB_PATH):
+    _ensure_schema(db_path)
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _insert_many(conn, records):
+    """Insert records and their skill rows with one executemany per table (inside the caller's transaction)."""
+    next_id = (conn.execute("SELECT MAX(id) FROM results").fetchone()[0] or 0) + 1
+    next_missing_rowid = (conn.execute("SELECT MAX(rowid) FROM missing_skills").fetchone()[0] or 0) + 1
+    rows = []
+    skill_rows = {table: [] for table in SKILL_TABLES}
+    for rid, record in enumerate(records, start=next_id):
+        extra = {k: v for k, v in record.items() if k not in CORE_FIELDS and k not in SKILL_TABLES}
+        score = record.get("score")
+        try:
+            score = float(score) if score is not None else None
+        except (TypeError, ValueError):
+            score = None
+        rows.append((
+            rid,
+            record.get("timestamp"),
+            record.get("candidate_name"),
+            record.get("job_title"),
+            score,
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+        ))
+        for table in SKILL_TABLES:
+            skills = [s for s in (record.get(table) or []) if isinstance(s, str)]
+            skill_rows[table].extend((rid, i, s, s.lower()) for i, s in enumerate(skills))
+
+    conn.executemany(
+        "INSERT INTO results (id, timestamp, candidate_name, job_title, score, extra) VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    for table, values in skill_rows.items():
+        conn.executemany(
+            f"INSERT INTO {table} (result_id, position, skill, skill_key) VALUES (?, ?, ?, ?)", values
+        )
+    _update_rollups(conn, rows, records, next_missing_rowid)
+
+
+def _bucket_key(timestamp, job_title, score):
+    day = timestamp[:10] if isinstance(timestamp, str) and DAY_RE.match(timestamp) else ""
+    band = -1 if score is None else min(max(int(math.floor(score)), 0), 100)
+    return day, job_title if isinstance(job_title, str) else "", band
+
+
+def _update_rollups(conn, rows, records, missing_rowid):
+    """
+    Fold freshly inserted rows into the rollup tables (same transaction as the insert).
+    missing_rowid is the rowid of the first missing_skills row just inserted; the
+    first one per skill is kept so top-missing ties break by first appearance.
+    """
+    daily = {}
+    skills = {}
+    for (_, timestamp, _, job_title, score, _), record in zip(rows, records):
+        key = _bucket_key(timestamp, job_title, score)
+        count, score_sum = daily.get(key, (0, 0.0))
+        daily[key] = (count + 1, score_sum + (score or 0.0))
+
+        resume = {s.lower() for s in (record.get("resume_skills") or []) if isinstance(s, str)}
+        for s in record.get("jd_skills") or []:
+            if isinstance(s, str):
+                entry = skills.setdefault(key + (s,), [0, 0, 0, None])
+                entry[0 if s.lower() in resume else 1] += 1
+        for s in record.get("missing_skills") or []:
+            if isinstance(s, str):
+                entry = skills.setdefault(key + (s,), [0, 0, 0, None])
+                entry[2] += 1
+                if entry[3] is None:
+                    entry[3] = missing_rowid
+                missing_rowid += 1
+
+    conn.executemany(
+        "INSERT INTO rollup_daily (day, job_title, score_band, count, score_sum) VALUES (?, ?, ?, ?, ?)"
+        " ON CONFLICT (day, job_title, score_band) DO UPDATE SET"
+        " count = count + excluded.count, score_sum = score_sum + excluded.score_sum",
+        [key + value for key, value in daily.items()],
+    )
+    conn.executemany(
+        "INSERT INTO rollup_skills"
+        " (day, job_title, score_band, skill, matched, missing, listed_missing, first_listed)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (day, job_title, score_band, skill) DO UPDATE SET"
+        " matched = matched + excluded.matched, missing = missing + excluded.missing,"
+        " listed_missing = listed_missing + excluded.listed_missing,"
+        " first_listed = COALESCE(first_listed, excluded.first_listed)",
+        [key + tuple(value) for key, value in skills.items()],
+    )
+
+
+def _parse_lines(chunk):
+    """Records in the complete lines of chunk, and the byte length those lines cover."""
+    end = chunk.rfind(b"\n") + 1  # leave a partially written line for next time
+    records = []
+    for line in chunk[:end].splitlines():
+        try:
+            rec = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(rec, dict):
+            records.append(rec)
+    return records, end
+
+
+def _rebuild(conn, archive_dir):
+    _truncate(conn)
+    for batch in results_archive.iter_archive(archive_dir):
+        _insert_many(conn, batch)
+
+
+def sync(db_path=DB_PATH, log_path=RESULTS_PATH, archive_dir=ARCHIVE_DIR):
+    """
+    Bring the database up to date with the JSON-Lines results log by ingesting
+    only the lines appended since the last sync. Returns the number of new rows.
+    A rebuild (log cleared, or older database) re-reads the Parquet archive first.
+    """
+    if not os.path.exists(log_path):
+        size = 0
+    else:
+        size = os.path.getsize(log_path)
+
+    with closing(connect(db_path)) as conn:
+        row = conn.execute("SELECT log_offset FROM sync_state WHERE log_path = ?", (log_path,)).fetchone()
+        offset = row["log_offset"] if row else 0
+        if row is not None and offset == size and not _rollups_missing(conn):
+            return 0
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # re-read under the write lock, another session may have synced meanwhile
+            row = conn.execute("SELECT log_offset FROM sync_state WHERE log_path = ?", (log_path,)).fetchone()
+            offset = row["log_offset"] if row else 0
+            if row is None or size < offset or _rollups_missing(conn):
+                # new db, log cleared or replaced, or a db from before rollups -> rebuild from scratch
+                _rebuild(conn, archive_dir)
+                offset = 0
+
+            records = []
+            if size > offset:
+                with open(log_path, "rb") as f:
+                    f.seek(offset)
+                    records, end = _parse_lines(f.read(size - offset))
+                _insert_many(conn, records)
+                offset += end
+
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (log_path, log_offset) VALUES (?, ?)", (log_path, offset)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return len(records)
+
+
+def _part_id(data, records):
+    """Archive part name: first timestamp (so parts sort chronologically) + content hash."""
+    first = next((r["timestamp"] for r in records if isinstance(r.get("timestamp"), str)), "")
+    stamp = re.sub(r"\D", "", first)[:20].ljust(20, "0")
+    return f"{stamp}-{hashlib.sha1(data).hexdigest()[:12]}"
+
+
+def compact(db_path=DB_PATH, log_path=RESULTS_PATH, archive_dir=ARCHIVE_DIR, min_bytes=0):
+    """
+    Move the results log into the Parquet archive and start a fresh log. The
+    database keeps its rows; only its log offset is reset. Returns the number of
+    records archived (0 when the log is smaller than min_bytes).
+    """
+    rotated = log_path + ".compacting"
+    # one compaction at a time across sessions and processes; decide what to do
+    # only once holding it, so a concurrent run cannot rotate or delete under us
+    with file_lock(log_path + ".compact.lock"):
+        recovering = os.path.exists(rotated)  # an earlier compaction stopped after rotating the log
+        if not recovering:
+            size = os.path.getsize(log_path) if os.path.exists(log_path) else 0
+            if size == 0 or size < min_bytes:
+                return 0
+        return _compact_locked(db_path, log_path, archive_dir, rotated, recovering)
+
+
+def _compact_locked(db_path, log_path, archive_dir, rotated, recovering):
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if not recovering:
+                row = conn.execute("SELECT log_offset FROM sync_state WHERE log_path = ?", (log_path,)).fetchone()
+                offset = row["log_offset"] if row else 0
+                # writers hold this lock for the whole append, so none is mid-write
+                # on the old file; the next one creates a fresh log
+                with file_lock(lock_path(log_path)):
+                    os.replace(log_path, rotated)
+
+            with open(rotated, "rb") as f:
+                data = f.read()
+            records, _ = _parse_lines(data)
+            moved = results_archive.write_records(records, _part_id(data, records), archive_dir)
+
+            if recovering:
+                # unknown how much of the rotated log reached the db -> rebuild it from
+                # the archive; the next sync adds the fresh log from offset 0
+                _rebuild(conn, archive_dir)
+            else:
+                # ingest whatever the last sync had not seen yet
+                _insert_many(conn, _parse_lines(data[offset:])[0])
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (log_path, log_offset) VALUES (?, ?)", (log_path, 0)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    os.remove(rotated)
+    return moved
+
+
+def _rollups_missing(conn):
+    return conn.execute(
+        "SELECT EXISTS (SELECT 1 FROM results) AND NOT EXISTS (SELECT 1 FROM rollup_daily)"
+    ).fetchone()[0]
+
+
+def _truncate(conn):
+    for table in SKILL_TABLES + ROLLUP_TABLES + ("results", "sync_state"):
+        conn.execute(f"DELETE FROM {table}")
+
+
+def reset(db_path=DB_PATH):
+    with closing(connect(db_path)) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _truncate(conn)
+        conn.execute("COMMIT")
+
+
+# ----- filters -----
+def where_clause(job_title=None, min_score=None, start_date=None, end_date=None,
+                 after_id=None, before=None, candidate_name=None, alias="results"):
+    """
+    Compile the dashboard filters to a SQL WHERE clause and its parameters.
+    start_date / end_date are datetime.date objects and are inclusive;
+    after_id keeps rows after that row id (for batched reads);
+    before=(timestamp, id) keeps rows after that key in newest-first order.
+    """
+    parts = []
+    params = []
+    if before is not None:
+        ts, rid = before
+        if ts is None:
+            parts.append(f"{alias}.timestamp IS NULL AND {alias}.id < ?")
+            params.append(int(rid))
+        else:
+            parts.append(f"({alias}.timestamp, {alias}.id) < (?, ?)")
+            params.extend([ts, int(rid)])
+    if candidate_name is not None:
+        parts.append(f"{alias}.candidate_name = ?")
+        params.append(candidate_name)
+    if after_id is not None:
+        parts.append(f"{alias}.id > ?")
+        params.append(int(after_id))
+    if job_title and job_title != "All":
+        parts.append(f"{alias}.job_title = ?")
+        params.append(job_title)
+    if min_score is not None:
+        parts.append(f"{alias}.score >= ?")
+        params.append(float(min_score))
+    if start_date is not None:
+        parts.append(f"{alias}.timestamp >= ?")
+        params.append(datetime.combine(start_date, datetime.min.time()).isoformat())
+    if end_date is not None:
+        parts.append(f"{alias}.timestamp <= ?")
+        params.append(datetime.combine(end_date, datetime.max.time()).isoformat())
+    return (" WHERE " + " AND ".join(parts)) if parts else "", params
+
+
+# ----- queries -----
+def total_count(db_path=DB_PATH):
+    with closing(connect(db_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def job_titles(db_path=DB_PATH):
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT job_title FROM results WHERE job_title IS NOT NULL ORDER BY job_title"
+        ).fetchall()
+    return [r[0] for r in rows]
+
+
+def date_bounds(db_path=DB_PATH):
+    """(first, last) analysis datetime, or (None, None) when there are no timestamps."""
+    with closing(connect(db_path)) as conn:
+        lo, hi = conn.execute(
+            "SELECT MIN(timestamp), MAX(timestamp) FROM results WHERE timestamp IS NOT NULL"
+        ).fetchone()
+    try:
+        return datetime.fromisoformat(lo), datetime.fromisoformat(hi)
+    except (TypeError, ValueError):
+        return None, None
+
+
+# ----- rollup queries -----
+def rollup_where(job_title=None, min_score=None, start_date=None, end_date=None):
+    """
+    Same filters as where_clause, answered from the rollup buckets. Dates select
+    whole days; min_score is applied in whole percent (the dashboard slider's unit).
+    """
+    parts = []
+    params = []
+    if job_title and job_title != "All":
+        parts.append("job_title = ?")
+        params.append(job_title)
+    if min_score is not None:
+        parts.append("score_band >= ?")
+        params.append(max(int(math.ceil(min_score)), 0))
+    if start_date is not None:
+        parts.append("day >= ?")
+        params.append(start_date.isoformat())
+    if end_date is not None:
+        parts.append("day <= ?")
+        params.append(end_date.isoformat())
+    return (" WHERE " + " AND ".join(parts)) if parts else "", params
+
+
+def kpis(db_path=DB_PATH, **filters):
+    """Count, average score, distinct jobs and top missing skill for the filtered rows."""
+    where, params = rollup_where(**filters)
+    with closing(connect(db_path)) as conn:
+        count, score_sum, scored, job_count = conn.execute(
+            "SELECT SUM(count), SUM(score_sum), SUM(CASE WHEN score_band >= 0 THEN count END),"
+            f" COUNT(DISTINCT NULLIF(job_title, '')) FROM rollup_daily{where}",
+            params,
+        ).fetchone()
+        top = conn.execute(
+            f"SELECT skill, SUM(listed_missing) AS n FROM rollup_skills{where}"
+            " GROUP BY skill HAVING n > 0 ORDER BY n DESC, MIN(first_listed) LIMIT 1",
+            params,
+        ).fetchone()
+    return {
+        "count": count or 0,
+        "avg_score": round(score_sum / scored, 2) if scored else 0,
+        "job_count": job_count,
+        "top_missing": top[0] if top else None,
+    }
+
+
+def score_histogram(db_path=DB_PATH, **filters):
+    """Counts of filtered scores in HIST_BINS equal bins over 0-100 (100 falls in the last bin)."""
+    where, params = rollup_where(**filters)
+    where += (" AND" if where else " WHERE") + " score_band >= 0"
+    counts = [0] * HIST_BINS
+    width = 100 // HIST_BINS
+    with closing(connect(db_path)) as conn:
+        for band, n in conn.execute(
+            f"SELECT score_band, SUM(count) FROM rollup_daily{where} GROUP BY score_band", params
+        ):
+            counts[min(band // width, HIST_BINS - 1)] += n
+    return counts
+
+
+def skill_summary(db_path=DB_PATH, top=10, **filters):
+    """[(skill, matched, missing)] for the filtered rows, most-missed JD skills first."""
+    where, params = rollup_where(**filters)
+    with closing(connect(db_path)) as conn:
+        return [
+            tuple(r) for r in conn.execute(
+                f"SELECT skill, SUM(matched) AS hit, SUM(missing) AS miss FROM rollup_skills{where}"
+                " GROUP BY skill HAVING hit + miss > 0 ORDER BY miss DESC, skill LIMIT ?",
+                params + [int(top)],
+            )
+        ]
+
+
+def recent_page(db_path=DB_PATH, page_size=10, cursor=None, **filters):
+    """
+    One page of matching records, newest first, read by keyset on (timestamp, id)
+    so deep pages cost the same as the first. Pass the returned cursor back to get
+    the next page; it is None on the last page. Undated records come last.
+    """
+    newest_first = "timestamp DESC, id DESC"
+    rows = fetch_results(db_path, order_by=newest_first, limit=page_size + 1, with_id=True, before=cursor, **filters)
+    if len(rows) <= page_size and cursor is not None and cursor[0] is not None:
+        # the (timestamp, id) range skips NULL timestamps, which sort after every date
+        rows += fetch_results(
+            db_path, order_by="id DESC", limit=page_size + 1 - len(rows), with_id=True,
+            before=(None, 2 ** 63 - 1), **filters
+        )
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = (rows[-1]["timestamp"], rows[-1]["id"])
+    return rows, next_cursor
+
+
+def stage_timings(db_path=DB_PATH, limit=LATENCY_SAMPLE, **filters):
+    """
+    (job_title, file_type, stage, ms) for every timed stage of the latest `limit`
+    matching analyses that carry timings.
+    """
+    where, params = where_clause(**filters)
+    where += (" AND" if where else " WHERE") + " json_type(results.extra, '$.timings') = 'object'"
+    with closing(connect(db_path)) as conn:
+        return [
+            tuple(r) for r in conn.execute(
+                "SELECT r.job_title, COALESCE(json_extract(r.extra, '$.file_type'), ''), j.key, j.value"
+                f" FROM (SELECT job_title, extra FROM results{where} ORDER BY id DESC LIMIT ?) AS r,"
+                " json_each(r.extra, '$.timings') AS j",
+                params + [int(limit)],
+            )
+        ]
+
+
+def extra_fields(db_path=DB_PATH, **filters):
+    """Names of the non-core fields present in the matching records, in first-seen order."""
+    where, params = where_clause(**filters)
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute(
+            f"SELECT j.key FROM results, json_each(results.extra) AS j{where}"
+            " GROUP BY j.key ORDER BY MIN(results.id), j.key",
+            params,
+        ).fetchall()
+    return [r[0] for r in rows]
+
+
+def fetch_results(db_path=DB_PATH, order_by="id", limit=None, with_id=False, **filters):
+    """Matching records as dicts (skill lists re-attached), in order_by order; with_id adds the row "id"."""
+    where, params = where_clause(**filters)
+    sql = f"SELECT * FROM results{where} ORDER BY {order_by}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = params + [int(limit)]
+
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute(sql, params).fetchall()
+        records = {}
+        for r in rows:
+            rec = {"id": r["id"]} if with_id else {}
+            rec.update((k, r[k]) for k in CORE_FIELDS)
+            if r["extra"]:
+                rec.update(json.loads(r["extra"]))
+            for table in SKILL_TABLES:
+                rec[table] = []
+            records[r["id"]] = rec
+
+        if records:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (id INTEGER PRIMARY KEY)")
+            conn.execute("DELETE FROM wanted")
+            conn.executemany("INSERT INTO wanted (id) VALUES (?)", [(rid,) for rid in records])
+            for table in SKILL_TABLES:
+                for rid, skill in conn.execute(
+                    # CROSS JOIN keeps SQLite from scanning the skill table
+                    f"SELECT t.result_id, t.skill FROM wanted w CROSS JOIN {table} t ON t.result_id = w.id"
+                    f" ORDER BY t.result_id, t.position"
+                ):
+                    records[rid][table].append(skill)
+    return list(records.values())
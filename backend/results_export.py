@@ -0,0 +1,87 @@
+# backend/results_export.py
+"""
+On-demand export of stored analyses as CSV, gzip-compressed CSV or Parquet.
+Rows are read from the SQLite store in id order, EXPORT_BATCH at a time, and
+written out batch by batch, so the full history is never held as one frame.
+"""
+import gzip
+import io
+
+from backend import results_archive, results_db
+
+EXPORT_BATCH = 5000
+
+FORMATS = {
+    "csv": ("CSV", "resume_results.csv", "text/csv"),
+    "csv.gz": ("CSV (gzip)", "resume_results.csv.gz", "application/gzip"),
+    "parquet": ("Parquet", "resume_results.parquet", "application/vnd.apache.parquet"),
+}
+
+
+def available_formats():
+    return [f for f in FORMATS if f != "parquet" or results_archive.archive_installed()]
+
+
+def iter_batches(db_path=results_db.DB_PATH, batch_size=EXPORT_BATCH, **filters):
+    """Lists of matching records, walking the id index instead of loading every row."""
+    last_id = 0
+    while True:
+        batch = results_db.fetch_results(db_path, limit=batch_size, after_id=last_id, with_id=True, **filters)
+        if not batch:
+            return
+        last_id = batch[-1].pop("id")
+        for rec in batch[:-1]:
+            rec.pop("id")
+        yield batch
+
+
+def _write_csv(out, batches, columns):
+    import pandas as pd
+
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    header = True
+    for batch in batches:
+        pd.DataFrame(batch, columns=columns).to_csv(text, index=False, header=header)
+        header = False
+    if header:
+        pd.DataFrame(columns=columns).to_csv(text, index=False)
+    text.flush()
+    text.detach()
+
+
+def _write_parquet(out, batches):
+    import pyarrow.parquet as pq
+
+    writer = pq.ParquetWriter(out, results_archive.archive_schema(), compression="zstd")
+    try:
+        for batch in batches:
+            writer.write_table(results_archive.records_to_table(batch))
+    finally:
+        writer.close()
+
+
+def write_export(out, fmt="csv", db_path=results_db.DB_PATH, **filters):
+    """
+    Stream the records matching filters (none = everything) into the binary
+    file object out. CSV columns are the core fields, then every extra field
+    that occurs in the selection, then the skill lists.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    batches = iter_batches(db_path, **filters)
+    if fmt == "parquet":
+        _write_parquet(out, batches)
+        return
+
+    columns = list(results_db.CORE_FIELDS) + results_db.extra_fields(db_path, **filters) + list(results_db.SKILL_TABLES)
+    if fmt == "csv.gz":
+        with gzip.GzipFile(fileobj=out, mode="wb") as gz:
+            _write_csv(gz, batches, columns)
+    else:
+        _write_csv(out, batches, columns)
+
+
+def export_bytes(fmt="csv", db_path=results_db.DB_PATH, **filters):
+    buf = io.BytesIO()
+    write_export(buf, fmt, db_path, **filters)
+    return buf.getvalue()
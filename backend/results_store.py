@@ -0,0 +1,155 @@
+# backend/results_store.py
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+from backend.file_lock import file_lock
+
+DATA_DIR = "data"
+RESULTS_PATH = os.path.join(DATA_DIR, "results.jsonl")
+LEGACY_RESULTS_PATH = os.path.join(DATA_DIR, "results.json")
+
+GROUP_COMMIT_MS = 20  # how long the writer waits for other sessions to join a commit
+
+
+def lock_path(path=RESULTS_PATH):
+    """Side file locked by every writer (and by compaction) of the log at path."""
+    return path + ".lock"
+
+
+def _write_locked(path, payload):
+    """Append payload to the log under its file lock and fsync it."""
+    with file_lock(lock_path(path)):
+        # opened after locking: compaction may have just rotated the log
+        with open(path, "a+b") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # a crash left a torn last line; don't glue this write onto it
+                    payload = b"\n" + payload
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class _GroupCommitWriter:
+    """
+    Single writer thread for one log. Every session thread queues its payload and
+    waits; the writer appends whatever has queued up within GROUP_COMMIT_MS in one
+    locked write + fsync, then acknowledges all of them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._cond = threading.Condition()
+        self._queue = []  # (payload, Future)
+        self._thread = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, payload):
+        done = Future()
+        with self._cond:
+            self._queue.append((payload, done))
+            self._cond.notify()
+        return done
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+            time.sleep(GROUP_COMMIT_MS / 1000)
+            with self._cond:
+                group, self._queue = self._queue, []
+            try:
+                _write_locked(self.path, b"".join(payload for payload, _ in group))
+            except Exception as e:
+                for _, done in group:
+                    done.set_exception(e)
+            else:
+                for _, done in group:
+                    done.set_result(None)
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(path=RESULTS_PATH):
+    """The process-wide group-commit writer for the log at path."""
+    key = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            folder = os.path.dirname(key)
+            os.makedirs(folder, exist_ok=True)
+            writer = _writers[key] = _GroupCommitWriter(path)
+        return writer
+
+
+def append_results(records, path=RESULTS_PATH):
+    """
+    Durably append records to the JSON-Lines results log. Returns once they are
+    fsynced; records from concurrent sessions share one write.
+    """
+    if not records:
+        return
+    payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+    get_writer(path).submit(payload).result()
+
+
+def append_result(record, path=RESULTS_PATH):
+    append_results([record], path)
+
+
+def iter_results(path=RESULTS_PATH):
+    """Yield records one line at a time; unreadable lines (e.g. a torn last write) are skipped."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(rec, dict):
+                yield rec
+
+
+def load_results(path=RESULTS_PATH):
+    return list(iter_results(path))
+
+
+def clear_results(path=RESULTS_PATH):
+    with file_lock(lock_path(path)):
+        open(path, "w", encoding="utf-8").close()
+
+
+def migrate_legacy_results(legacy_path=LEGACY_RESULTS_PATH, path=RESULTS_PATH):
+    """
+    One-time move of the old results.json array into the JSON-Lines log.
+    The old file is kept as results.json.migrated. Returns the number of records moved.
+    """
+    migrated_path = legacy_path + ".migrated"
+    try:
+        # claim the file first so two sessions never migrate it twice
+        os.replace(legacy_path, migrated_path)
+    except OSError:
+        return 0
+    try:
+        with open(migrated_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            data = []
+    except Exception:
+        data = []
+
+    records = [r for r in data if isinstance(r, dict)]
+    append_results(records, path)
+    return len(records)
@@ -1,56 +1,246 @@
 # backend/resume_parser.py
 import re
-from PyPDF2 import PdfReader
-from docx import Document
-from PIL import Image
+import time
+from itertools import islice
 import io
 
+from backend.job_profiles import ALL_SKILLS
+from backend.parse_cache import get_parse_cache
+from backend.pdf_backends import get_backend, resolve_backend
+from backend.skill_catalog import get_catalog, get_skill_matcher
+
+# --- PDF page streaming with page / wall-clock budgets ---
+PDF_MAX_PAGES = 30        # resumes are short; long portfolios are cut here
+PDF_TIME_BUDGET = 10.0    # seconds of PyPDF2 work per file
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_RE = re.compile(r"(\+?\d[\d \-\(\)]{8,}\d)")
+
+
+def iter_pdf_pages(source, max_pages=PDF_MAX_PAGES, time_budget=PDF_TIME_BUDGET, status=None, backend=None):
+    """
+    Lazily yield the text of each PDF page (pages without text are skipped),
+    using the configured PDF backend (see backend/pdf_backends.py).
+    Stops after max_pages pages or once time_budget seconds have passed; if a
+    status dict is given, status["timed_out"] tells whether the time budget cut it short.
+    """
+    pages = get_backend(backend)(source)
+    if max_pages is not None:
+        pages = islice(pages, max_pages)
+    deadline = time.monotonic() + time_budget if time_budget else None
+    while deadline is None or time.monotonic() <= deadline:
+        page_text = next(pages, None)
+        if page_text is None:
+            return
+        if page_text:
+            yield page_text
+    if status is not None:
+        status["timed_out"] = True
+
+
+def read_pdf_text(source, max_pages=PDF_MAX_PAGES, time_budget=PDF_TIME_BUDGET, early_exit_skills=None,
+                  backend=None):
+    """
+    Join page texts with one join instead of repeated string concatenation.
+
+    With early_exit_skills=N, reading stops as soon as the header details (email
+    and phone) and at least N distinct catalog skills have been seen.
+    Returns (text, complete) where complete is False if the time budget cut it short.
+    """
+    status = {"timed_out": False}
+    parts = []
+    seen_skills = set()
+    header_found = False
+    matcher = get_skill_matcher(ALL_SKILLS) if early_exit_skills else None
+
+    for page_text in iter_pdf_pages(source, max_pages, time_budget, status, backend):
+        parts.append(page_text)
+        if matcher is None:
+            continue
+        if not header_found:
+            so_far = "\n".join(parts)
+            header_found = bool(EMAIL_RE.search(so_far) and PHONE_RE.search(so_far))
+        seen_skills.update(matcher.match_indices(page_text))
+        if header_found and len(seen_skills) >= early_exit_skills:
+            break
+
+    text = "".join(p + "\n" for p in parts)
+    # page and skill limits are deterministic; only a wall-clock cut makes the result incomplete
+    return text, not status["timed_out"]
+
+
+# --- resume bytes -> (text, image bytes), as used by the Resume Analyzer page ---
+def _extract_text_and_image(file_bytes, filename, max_pages=PDF_MAX_PAGES, early_exit_skills=None):
+    text = ""
+    image_bytes = None
+    fname = filename.lower()
+    complete = True
+
+    if fname.endswith(".pdf"):
+        text, complete = read_pdf_text(
+            io.BytesIO(file_bytes), max_pages=max_pages, early_exit_skills=early_exit_skills
+        )
+        image_bytes = None
+
+    elif fname.endswith(".docx"):
+        from docx import Document
+        from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+        bio = io.BytesIO(file_bytes)
+        doc = Document(bio)
+        text = "\n".join([p.text for p in doc.paragraphs])
+
+        # Try to extract first embedded image if any
+        try:
+            for rel in doc.part.rels.values():
+                if rel.reltype == RT.IMAGE:
+                    image_part = rel.target_part
+                    image_bytes = image_part.blob
+                    break
+        except Exception:
+            image_bytes = None
+
+    elif fname.endswith(".txt"):
+        text = file_bytes.decode("utf-8", errors="ignore")
+        image_bytes = None
+
+    return text, image_bytes, complete
+
+
+def extract_text_and_image(file_bytes, filename, max_pages=PDF_MAX_PAGES, early_exit_skills=None):
+    """
+    Read resume bytes and return (text, image_bytes or None).
+    Photo extraction is implemented for DOCX. For PDFs, only text for now, read
+    page by page within PDF_MAX_PAGES / PDF_TIME_BUDGET (see read_pdf_text).
+    Results are cached by the SHA-256 of the bytes, so re-scoring a resume skips parsing.
+    """
+    ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
+    namespace = f"analyzer-{ext}"
+    if ext == "pdf":
+        namespace += f"-{resolve_backend()}"  # the backend actually used, not the raw setting
+        if max_pages != PDF_MAX_PAGES or early_exit_skills:
+            namespace += f"-p{max_pages}-s{early_exit_skills or 0}"
+    return get_parse_cache().get_or_parse(
+        file_bytes,
+        namespace,
+        lambda: _extract_text_and_image(file_bytes, filename, max_pages, early_exit_skills),
+    )
+
+
 # --- robust text extractor for PDF or DOCX file path ---
+def _read_source(path_or_file):
+    """Return (bytes, kind) where kind is "pdf", "docx" or "" (unsupported path)."""
+    if isinstance(path_or_file, str):
+        with open(path_or_file, "rb") as f:
+            data = f.read()
+        low = path_or_file.lower()
+        kind = "pdf" if low.endswith(".pdf") else "docx" if low.endswith(".docx") else ""
+    else:
+        # file-like (Streamlit upload): PDF by mime type, otherwise try docx
+        if hasattr(path_or_file, "getvalue"):
+            data = path_or_file.getvalue()
+        else:
+            data = path_or_file.read()
+        kind = "pdf" if hasattr(path_or_file, "type") and "pdf" in path_or_file.type else "docx"
+    return data, kind
+
+
+def _parse_text(data, kind):
+    text = ""
+    complete = True
+    try:
+        if kind == "pdf":
+            text, complete = read_pdf_text(io.BytesIO(data))
+        elif kind == "docx":
+            from docx import Document
+
+            doc = Document(io.BytesIO(data))
+            text = "".join(para.text + "\n" for para in doc.paragraphs if para.text)
+    except Exception:
+        pass
+    return (text or "").strip(), None, complete
+
+
 def extract_text_from_file(path_or_file):
     """
     Accepts either a path string (saved file) or a file-like object (Streamlit upload).
-    Returns extracted text (string).
+    Returns extracted text (string), cached by the SHA-256 of the file bytes.
     """
-    text = ""
     try:
-        # If it's a path string (common in our pages), open accordingly
-        if isinstance(path_or_file, str):
-            if path_or_file.lower().endswith(".pdf"):
-                reader = PdfReader(path_or_file)
-                for page in reader.pages:
-                    ptxt = page.extract_text()
-                    if ptxt:
-                        text += ptxt + "\n"
-            elif path_or_file.lower().endswith(".docx"):
-                doc = Document(path_or_file)
-                for para in doc.paragraphs:
-                    if para.text:
-                        text += para.text + "\n"
-        else:
-            # file-like (Streamlit upload)
-            if hasattr(path_or_file, "type") and "pdf" in path_or_file.type:
-                reader = PdfReader(path_or_file)
-                for page in reader.pages:
-                    ptxt = page.extract_text()
-                    if ptxt:
-                        text += ptxt + "\n"
-            else:
-                # try docx
-                try:
-                    doc = Document(path_or_file)
-                    for para in doc.paragraphs:
-                        if para.text:
-                            text += para.text + "\n"
-                except Exception:
-                    pass
+        data, kind = _read_source(path_or_file)
     except Exception:
-        pass
-    return (text or "").strip()
+        return ""
+    if not kind:
+        return ""
+    namespace = f"parser-{kind}-{resolve_backend()}" if kind == "pdf" else f"parser-{kind}"
+    text, _ = get_parse_cache().get_or_parse(data, namespace, lambda: _parse_text(data, kind))
+    return text
 
 # short alias for readability
 def extract_text_from_pdf(path_or_file):
     return extract_text_from_file(path_or_file)
 
+# --- details used by the Resume Analyzer page (name, email, phone, links) ---
+def guess_name_from_email(email: str) -> str:
+    """Guess a name from the email local-part (before @)."""
+    local = email.split("@")[0]
+    local = re.sub(r"[_\.]+", " ", local)  # replace _ and . with space
+    parts = [p for p in local.split() if p.isalpha()]
+    if not parts:
+        return ""
+    return " ".join(p.capitalize() for p in parts)
+
+
+def extract_basic_details(text: str, candidate_name_input: str = ""):
+    """
+    Extract details: name, email, phone, links from resume text.
+    """
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    email = None
+    phone = None
+    links = []
+
+    # Email
+    email_match = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+    if email_match:
+        email = email_match.group(0)
+
+    # Phone (simple, allows +91, spaces, dashes, brackets)
+    phone_match = re.search(r"(\+?\d[\d \-\(\)]{8,}\d)", text)
+    if phone_match:
+        phone = phone_match.group(1)
+
+    # Links
+    links = re.findall(r"(https?://\S+)", text)
+
+    # Name heuristic priority:
+    # 1. user input
+    # 2. from top lines
+    # 3. from email local part
+    name = candidate_name_input.strip() if candidate_name_input else ""
+
+    if not name:
+        for line in lines[:7]:  # look at first few lines
+            lower = line.lower()
+            if any(x in lower for x in ["resume", "curriculum vitae", "cv", "@", "http", "www."]):
+                continue
+            if sum(c.isalpha() for c in line) < 3:
+                continue
+            words = line.split()
+            if 1 <= len(words) <= 4:
+                if sum(w[0].isupper() for w in words if w and w[0].isalpha()) >= 1:
+                    name = line
+                    break
+
+    if not name and email:
+        name = guess_name_from_email(email)
+
+    return {
+        "name": name,
+        "email": email or "",
+        "phone": phone or "",
+        "links": links,
+    }
+
 # --- extract email, name, links ---
 def extract_user_details(text):
     text = text or ""
@@ -81,25 +271,9 @@ def extract_user_details(text):
 
     return {"name": name or None, "email": email or None, "links": links or []}
 
-# --- skills detection using a curated list ---
-SKILLS_DB = [
-    "python","sql","excel","power bi","tableau","pandas","numpy","machine learning",
-    "deep learning","tensorflow","pytorch","data analysis","statistics","r","matlab",
-    "html","css","javascript","react","node.js","java","c++","c#","django","flask","aws","azure","git"
-]
-
+# --- skills detection using the skill catalog (Data/skills_catalog.json) ---
 def extract_skills_from_text(text):
-    t = (text or "").lower()
-    found = []
-    for s in SKILLS_DB:
-        if re.search(rf"\b{re.escape(s)}\b", t):
-            found.append(s)
-    # dedupe
-    out = []
-    for x in found:
-        if x not in out:
-            out.append(x)
-    return out
+    return get_catalog().find(text)
 
 # wrapper naming consistency
 def extract_skills(text):
@@ -108,6 +282,9 @@ def extract_skills(text):
 # --- optional: extract first image from PDF (returns PIL Image) ---
 def extract_image_from_pdf_safe(path_or_file):
     try:
+        from PIL import Image
+        from PyPDF2 import PdfReader
+
         if isinstance(path_or_file, str) and path_or_file.lower().endswith(".pdf"):
             reader = PdfReader(path_or_file)
         else:
@@ -1,7 +1,8 @@
-from docx import Document
 from io import BytesIO
 
 def generate_docx_template_bytes(name, email, links, job_title, skills, summary):
+    from docx import Document
+
     doc = Document()
 
     doc.add_heading(f"Resume - {name}", 0)
@@ -27,3 +28,279 @@ def generate_docx_template_bytes(name, email, links, job_title, skills, summary)
     buf = BytesIO()
     doc.save(buf)
     return buf.getvalue()
+
+
+def categorize_role(job_title: str) -> str:
+    """Roughly map job title to a template category."""
+    t = job_title.lower()
+
+    if any(x in t for x in ["sales", "business development", "account manager"]):
+        return "sales"
+    if any(x in t for x in ["data scientist", "data analyst", "ml", "machine learning", "ai"]):
+        return "data"
+    if any(x in t for x in ["developer", "engineer", "devops", "cloud", "software", "frontend", "backend", "full stack"]):
+        return "tech"
+    if any(x in t for x in ["product manager", "project manager", "scrum", "business analyst"]):
+        return "pm_ba"
+    if any(x in t for x in ["ui/ux", "ux", "designer"]):
+        return "design"
+    if any(x in t for x in ["support", "customer success", "helpdesk"]):
+        return "support"
+    if any(x in t for x in ["finance", "financial", "accountant"]):
+        return "finance"
+    if any(x in t for x in ["hr", "human resources", "talent acquisition"]):
+        return "hr"
+    return "generic"
+
+
+def generate_resume_template(job_title, candidate_name, matched_skills, missing_skills, jd_text: str = ""):
+    """
+    Create a tailored resume template text for the selected job.
+    - Template changes based on job_title category.
+    - JD text is used to guide the summary section.
+    """
+    name_display = candidate_name if candidate_name else "Your Name"
+    all_skills_for_section = matched_skills + missing_skills
+    skills_line = ", ".join(all_skills_for_section) if all_skills_for_section else f"{job_title} core skills"
+
+    # Use first meaningful line of JD as a one-line role context if available
+    jd_summary_line = ""
+    if jd_text:
+        lines = [l.strip() for l in jd_text.splitlines() if l.strip()]
+        if lines:
+            sentence = lines[0]
+            if len(sentence) > 10:
+                jd_summary_line = sentence
+
+    category = categorize_role(job_title)
+
+    # ==== SUMMARY & EXPERIENCE BLOCKS BY CATEGORY ====
+    if category == "tech":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} with strong fundamentals in software engineering and problem solving."}
+Experienced in building, testing, and maintaining reliable applications and services.
+Comfortable working with modern development practices, version control, and agile teams.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Design, develop, and maintain applications following clean code and best practices.
+• Collaborate with cross-functional teams to deliver features from concept to production.
+• Debug, profile, and optimize code to improve performance and reliability.
+• Use tools and technologies related to: {skills_line}.
+
+Previous Company | Software Developer / Intern | Location | MM/YYYY – MM/YYYY
+• Worked on modules or features that contributed directly to business outcomes.
+• Wrote maintainable, testable code and participated in code reviews.
+• Integrated APIs, databases, or cloud services as required by the project.
+"""
+    elif category == "data":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} with a strong focus on turning data into actionable insights."}
+Hands-on experience in data cleaning, analysis, visualization, and building predictive models.
+Comfortable working with large datasets and communicating findings to stakeholders.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Collect, clean, and prepare datasets for analysis and modeling.
+• Build dashboards/reports that track key business or product metrics.
+• Apply statistical and machine learning techniques to solve business problems.
+• Use tools and technologies related to: {skills_line}.
+
+Previous Company | Data Analyst / Intern | Location | MM/YYYY – MM/YYYY
+• Assisted in data exploration and visualization for regular reporting.
+• Helped stakeholders interpret data and supported decision making.
+"""
+    elif category == "sales":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"Results-driven {job_title} with a strong track record in lead generation and deal closure."}
+Proven ability to build relationships, understand customer needs, and exceed revenue targets.
+Skilled in managing pipelines, handling objections, and closing deals.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Own and manage a sales pipeline from prospecting to closing.
+• Conduct product demos, presentations, and negotiations with prospects.
+• Consistently achieve or exceed monthly/quarterly sales targets.
+• Maintain accurate records in CRM and follow up with clients proactively.
+
+Previous Company | Sales Executive / Inside Sales | Location | MM/YYYY – MM/YYYY
+• Generated leads via cold calling, email outreach, and social channels.
+• Qualified prospects based on fit, budget, authority, and timeline.
+• Supported senior sales staff with proposals and follow-ups.
+"""
+    elif category == "pm_ba":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} with experience in requirements gathering, stakeholder communication, and delivery."}
+Skilled in translating business needs into clear user stories and collaborating with cross-functional teams.
+Comfortable managing scope, priorities, and timelines in dynamic environments.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Gather and document business requirements and user needs.
+• Define user stories, acceptance criteria, and maintain product backlog.
+• Collaborate with engineering, design, and stakeholders to deliver features.
+• Track progress, risks, and communicate status transparently.
+
+Previous Company | Business Analyst / Project Coordinator | Location | MM/YYYY – MM/YYYY
+• Analyzed processes and identified gaps and opportunities for improvement.
+• Supported project planning, tracking, and reporting activities.
+"""
+    elif category == "design":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"Creative {job_title} focused on crafting intuitive and visually appealing user experiences."}
+Experienced in user research, wireframing, prototyping, and design handoff to engineering teams.
+Comfortable iterating based on feedback and usability testing.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Design user interfaces for web/mobile in collaboration with product and engineering.
+• Conduct or review user research and usability tests to validate design decisions.
+• Create wireframes, prototypes, and design specs using tools like Figma/Sketch.
+• Maintain and contribute to design systems and component libraries.
+
+Previous Company | UI/UX Designer / Intern | Location | MM/YYYY – MM/YYYY
+• Assisted in designing features and flows for digital products.
+• Created visual assets and helped maintain consistent branding.
+"""
+    elif category == "support":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} focused on delivering excellent customer experiences and efficient issue resolution."}
+Experienced in handling tickets, calls, and chats while maintaining high satisfaction scores.
+Strong communication, patience, and problem-solving skills.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Respond to customer queries via phone, email, or chat within defined SLAs.
+• Troubleshoot issues, coordinate with internal teams, and ensure resolution.
+• Maintain detailed case notes and contribute to knowledge base articles.
+• Track and report recurring issues or feedback patterns.
+
+Previous Company | Customer Support / Service Desk | Location | MM/YYYY – MM/YYYY
+• Handled first-level support, escalating complex issues as needed.
+• Assisted in onboarding new users and explaining product features.
+"""
+    elif category == "finance":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} with experience in financial analysis, reporting, and forecasting."}
+Strong analytical skills, attention to detail, and ability to present insights clearly.
+Familiar with budgeting, variance analysis, and management reports.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Analyze financial statements, KPIs, and trends to support decision making.
+• Assist in preparing budgets, forecasts, and monthly/quarterly reports.
+• Build and maintain financial models in Excel / BI tools.
+• Work closely with business teams to track spend and performance.
+
+Previous Company | Financial Analyst / Intern | Location | MM/YYYY – MM/YYYY
+• Supported financial planning and analysis activities.
+• Prepared basic reports and reconciliations under supervision.
+"""
+    elif category == "hr":
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} experienced in recruitment, onboarding, and employee engagement."}
+Strong interpersonal skills and understanding of HR processes and policies.
+Comfortable partnering with leadership and employees to support people initiatives.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Manage end-to-end recruitment for assigned roles (JD, sourcing, screening, offers).
+• Coordinate onboarding, induction, and documentation for new hires.
+• Support performance management, feedback cycles, and HR operations.
+
+Previous Company | HR Executive / Recruiter | Location | MM/YYYY – MM/YYYY
+• Assisted in scheduling interviews, background checks, and HR documentation.
+• Helped organize employee engagement activities and events.
+"""
+    else:  # generic
+        summary = f"""
+SUMMARY
+{jd_summary_line or f"{job_title} with a strong focus on delivering measurable outcomes and supporting business goals."}
+Skilled in collaborating with cross-functional teams, learning quickly, and adapting to new tools and domains.
+"""
+        experience_block = f"""
+PROFESSIONAL EXPERIENCE
+Company Name | {job_title} | Location | MM/YYYY – Present
+• Describe your main responsibilities and how they relate to {job_title}.
+• Highlight 2–4 achievements with measurable impact (revenue, efficiency, satisfaction).
+• Mention important tools, systems, or methods you use.
+
+Previous Company | Previous Role | Location | MM/YYYY – MM/YYYY
+• Add relevant experience that supports your transition or growth in {job_title}.
+"""
+
+    # ==== FINAL TEMPLATE ASSEMBLY ====
+    template = f"""
+{name_display}
+{job_title}
+City, Country • Phone • Email • LinkedIn / Portfolio
+
+{summary.strip()}
+
+KEY SKILLS
+• {skills_line}
+
+{experience_block.strip()}
+
+PROJECTS
+Project Name | Tech/Tools used
+• Short description of the project objective and your role.
+• Mention specific responsibilities and impact (e.g., metrics improved).
+
+Project Name | Academic / Personal Project
+• Describe the problem you solved or value you created.
+• Add responsibilities and impact relevant to {job_title}.
+
+EDUCATION
+Degree Name (e.g., B.Tech in CSE / BBA / MBA / etc.)
+College / University Name | Location | Graduation Year
+• Include CGPA / Percentage (if strong and relevant).
+• Add coursework relevant to {job_title}.
+
+CERTIFICATIONS & TRAINING
+• Certification or Course Name – Platform / Institution – Year
+• Short workshops or online courses relevant to this role.
+
+ACHIEVEMENTS
+• Awards, recognitions, or performance-based achievements.
+• Competitions, hackathons, sales awards, or other highlights.
+
+EXTRACURRICULAR / LEADERSHIP (Optional)
+• Leadership roles, volunteering, or organizing activities.
+
+REFERENCES
+Available on request.
+"""
+    return template.strip()
+
+
+def build_docx_from_template_text(template_text: str) -> bytes:
+    """
+    Take the generated template text and create a .docx file,
+    line by line so the user can easily edit it.
+    """
+    from docx import Document
+
+    doc = Document()
+    for line in template_text.splitlines():
+        doc.add_paragraph(line)
+    bio = BytesIO()
+    doc.save(bio)
+    bio.seek(0)
+    return bio.read()
@@ -1,9 +1,10 @@
 # backend/resume_template.py
-from docx import Document
-from docx.shared import Pt
 import io
 
 def generate_docx_template_bytes(name, email, links, job_title, skills_list, summary_text):
+    from docx import Document
+    from docx.shared import Pt
+
     doc = Document()
     # Title (name)
     h = doc.add_heading(level=0)
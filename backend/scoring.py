@@ -0,0 +1,88 @@
+# backend/scoring.py
+import numpy as np
+
+from backend.job_profiles import JOB_PROFILES, ALL_SKILLS
+from backend.skill_catalog import get_catalog, get_skill_matcher
+
+
+def build_catalog(*skill_lists):
+    """
+    Merge skill lists into one catalog, deduplicated case-insensitively and by
+    skill catalog alias ("JS" and "JavaScript" are one column; first spelling wins).
+    """
+    skill_key = get_catalog().key
+    catalog = []
+    seen = set()
+    for skills in skill_lists:
+        for s in skills or []:
+            key = skill_key(s)
+            if key not in seen:
+                seen.add(key)
+                catalog.append(s)
+    return catalog
+
+
+def resume_incidence(resume_texts, catalog):
+    """N x K 0/1 matrix: row i marks the catalog skills found in resume_texts[i]."""
+    matcher = get_skill_matcher(catalog)
+    mat = np.zeros((len(resume_texts), len(catalog)), dtype=np.float32)
+    for i, text in enumerate(resume_texts):
+        mat[i, matcher.match_indices(text)] = 1.0
+    return mat
+
+
+def skills_incidence(skill_lists, catalog):
+    """
+    M x K count matrix for already-extracted skill lists (JD skills, stored resume skills).
+    Skills outside the catalog are ignored; duplicates are counted like the per-pair loop does.
+    """
+    skill_key = get_catalog().key
+    col = {skill_key(s): j for j, s in enumerate(catalog)}
+    mat = np.zeros((len(skill_lists), len(catalog)), dtype=np.float32)
+    for i, skills in enumerate(skill_lists):
+        for s in skills or []:
+            j = col.get(skill_key(s))
+            if j is not None:
+                mat[i, j] += 1.0
+    return mat
+
+
+def score_matrix(resume_matrix, jd_matrix, jd_totals):
+    """
+    Coverage scores for every resume x JD pair from one matrix multiply.
+
+    Equal to round(100 * len(matched_skills) / total, 2) per pair, where total is
+    the JD skill count (1 for an empty JD, as in the analyzer page).
+    """
+    matched = (resume_matrix @ jd_matrix.T).astype(np.int64)
+    totals = np.asarray(jd_totals, dtype=np.int64)
+    totals = np.where(totals > 0, totals, 1)
+
+    # Round through a per-JD lookup table so results match Python's round() exactly
+    table = np.zeros((len(totals), int(totals.max(initial=1)) + 1))
+    for j, total in enumerate(totals):
+        for k in range(total + 1):
+            table[j, k] = round(100 * k / total, 2)
+    return table[np.arange(len(totals))[None, :], matched]
+
+
+def score_resumes(resume_texts, jd_skill_lists=None):
+    """
+    Score many resumes against many JDs at once.
+
+    jd_skill_lists defaults to every JOB_PROFILES role. Returns (scores, jd_names)
+    where scores is an N x M array and jd_names labels its columns.
+    """
+    if jd_skill_lists is None:
+        jd_skill_lists = {role: p["skills"] for role, p in JOB_PROFILES.items()}
+    if isinstance(jd_skill_lists, dict):
+        jd_names = list(jd_skill_lists.keys())
+        jd_skill_lists = list(jd_skill_lists.values())
+    else:
+        jd_names = list(range(len(jd_skill_lists)))
+
+    catalog = build_catalog(ALL_SKILLS, *jd_skill_lists)
+    resume_matrix = resume_incidence(list(resume_texts), catalog)
+    jd_matrix = skills_incidence(jd_skill_lists, catalog)
+    jd_totals = [len(skills or []) for skills in jd_skill_lists]
+    return score_matrix(resume_matrix, jd_matrix, jd_totals), jd_names
@@ -0,0 +1,306 @@
+# backend/skill_catalog.py
+"""
+The one skill catalog: canonical skill ids, display names and aliases.
+
+Data/skills_catalog.json is the source:
+
+    {"version": 2, "skills": [{"id": "kubernetes", "name": "Kubernetes", "aliases": ["K8s"]}, ...]}
+
+It is compiled offline into Data/skills_catalog.compiled.json, which holds the
+id table and the ready-built token automaton, so loading it is a JSON read:
+
+    python -m backend.skill_catalog            # compile
+    python -m backend.skill_catalog --check    # exit 1 if the compiled file is stale
+
+get_catalog() loads it lazily once per process and re-checks the files every
+RELOAD_CHECK_SECONDS, so an edited catalog or a newly compiled artifact is
+picked up without a restart (a stale artifact is recompiled from the source).
+get_skill_matcher(skills) matches any skill list through the catalog, so an
+alias in the text ("JS", "sklearn", "Postgres") counts as the listed skill.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+
+from backend.skill_matcher import SkillMatcher, normalize
+
+SOURCE_PATH = os.path.join("Data", "skills_catalog.json")
+ARTIFACT_PATH = os.path.join("Data", "skills_catalog.compiled.json")
+ARTIFACT_FORMAT = 1
+RELOAD_CHECK_SECONDS = 2.0
+
+
+def _slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+class SkillCatalog:
+    """Canonical skills, every spelling of them, and one automaton over all spellings."""
+
+    def __init__(self, version, digest, ids, names, aliases, matcher):
+        self.version = version
+        self.digest = digest
+        self.ids = ids
+        self.names = names
+        self.aliases = aliases
+        self.matcher = matcher
+        self._index = {}
+        for i, (sid, name, extra) in enumerate(zip(ids, names, aliases)):
+            for form in (sid, name, *extra):
+                self._index.setdefault(normalize(form), i)
+
+    @property
+    def label(self):
+        return f"v{self.version}+{self.digest[:8]}"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def index(self, skill):
+        """Catalog position of a skill given by id, name or alias; None if unknown."""
+        return self._index.get(normalize(skill))
+
+    def canonical_id(self, skill):
+        i = self.index(skill)
+        return None if i is None else self.ids[i]
+
+    def canonical_name(self, skill):
+        """Display name for a skill; unknown skills come back unchanged."""
+        i = self.index(skill)
+        return skill if i is None else self.names[i]
+
+    def key(self, skill):
+        """Comparison key: the canonical id, or the normalized text for skills outside the catalog."""
+        i = self.index(skill)
+        return normalize(skill) if i is None else self.ids[i]
+
+    def find(self, text):
+        """Canonical names of every catalog skill in text, in catalog order."""
+        return [self.names[i] for i in self.matcher.match_indices(text)]
+
+    # ----- compiled artifact -----
+    def to_artifact(self):
+        return {
+            "format": ARTIFACT_FORMAT,
+            "version": self.version,
+            "source_sha256": self.digest,
+            "ids": self.ids,
+            "names": self.names,
+            "aliases": self.aliases,
+            "automaton": self.matcher.to_state(),
+        }
+
+    @classmethod
+    def from_artifact(cls, data):
+        if data.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"unsupported skill catalog artifact format {data.get('format')!r}")
+        matcher = SkillMatcher.from_state(data["names"], data["automaton"])
+        return cls(data["version"], data["source_sha256"], data["ids"], data["names"], data["aliases"], matcher)
+
+
+def compile_catalog(source, digest=""):
+    """
+    Build a SkillCatalog from the parsed source file. A plain list of names (the
+    old catalog format) is accepted too. Raises ValueError on duplicate ids or
+    a spelling claimed by two skills.
+    """
+    if isinstance(source, list):
+        source = {"version": 1, "skills": [{"name": name} for name in source]}
+    ids, names, aliases = [], [], []
+    owner = {}  # normalized spelling -> skill id
+    for entry in source.get("skills", []):
+        name = entry["name"]
+        sid = entry.get("id") or _slug(name)
+        if sid in ids:
+            raise ValueError(f"duplicate skill id {sid!r}")
+        extra = list(entry.get("aliases", []))
+        for form in (name, *extra):
+            other = owner.setdefault(normalize(form), sid)
+            if other != sid:
+                raise ValueError(f"{form!r} is listed for both {other!r} and {sid!r}")
+        ids.append(sid)
+        names.append(name)
+        aliases.append(extra)
+
+    pairs = [(alias, i) for i, extra in enumerate(aliases) for alias in extra]
+    matcher = SkillMatcher(names, pairs)
+    return SkillCatalog(source.get("version", 1), digest, ids, names, aliases, matcher)
+
+
+def _read_source(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return json.loads(raw.decode("utf-8")), hashlib.sha256(raw).hexdigest()
+
+
+def read_catalog(path=SOURCE_PATH):
+    """Compile a catalog source file (no artifact involved)."""
+    source, digest = _read_source(path)
+    return compile_catalog(source, digest)
+
+
+def write_artifact(catalog, path=ARTIFACT_PATH):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(catalog.to_artifact(), f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def load_catalog(source_path=SOURCE_PATH, artifact_path=ARTIFACT_PATH):
+    """
+    The compiled artifact if it was built from the current source; otherwise the
+    source is compiled here and the artifact rewritten (best effort). With only
+    the artifact present it is used as is; with neither, the catalog is empty.
+    """
+    artifact = None
+    if os.path.exists(artifact_path):
+        with open(artifact_path, "r", encoding="utf-8") as f:
+            artifact = json.load(f)
+    if not os.path.exists(source_path):
+        if artifact is None:
+            return compile_catalog({"skills": []})
+        return SkillCatalog.from_artifact(artifact)
+
+    source, digest = _read_source(source_path)
+    if artifact is not None and artifact.get("source_sha256") == digest and artifact.get("format") == ARTIFACT_FORMAT:
+        return SkillCatalog.from_artifact(artifact)
+    catalog = compile_catalog(source, digest)
+    try:
+        write_artifact(catalog, artifact_path)
+    except OSError:
+        pass
+    return catalog
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+_catalog = None
+_catalog_stamp = None
+_checked_at = 0.0
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """Process-wide SkillCatalog, reloaded when the source or artifact file changes."""
+    global _catalog, _catalog_stamp, _checked_at
+    if _catalog is not None and time.monotonic() - _checked_at < RELOAD_CHECK_SECONDS:
+        return _catalog
+    with _catalog_lock:
+        now = time.monotonic()
+        if _catalog is not None and now - _checked_at < RELOAD_CHECK_SECONDS:
+            return _catalog
+        stamp = (_file_stamp(SOURCE_PATH), _file_stamp(ARTIFACT_PATH))
+        if _catalog is None or stamp != _catalog_stamp:
+            try:
+                _catalog = load_catalog(SOURCE_PATH, ARTIFACT_PATH)
+            except (OSError, ValueError, KeyError):
+                if _catalog is None:
+                    raise
+                # a half-edited catalog: keep serving the previous one
+            # stat again: load_catalog may have just rewritten the artifact
+            _catalog_stamp = (_file_stamp(SOURCE_PATH), _file_stamp(ARTIFACT_PATH))
+        _checked_at = now
+        return _catalog
+
+
+def canonical_name(skill):
+    return get_catalog().canonical_name(skill)
+
+
+def skill_key(skill):
+    return get_catalog().key(skill)
+
+
+# ----- matching arbitrary skill lists -----
+class CatalogMatcher:
+    """
+    SkillMatcher interface (skills, match_indices, find) for any skill list.
+
+    Listed skills known to the catalog are found through the catalog automaton,
+    aliases included; the rest get a small automaton of their own.
+    """
+
+    def __init__(self, catalog, skills):
+        self.skills = list(skills)
+        self._catalog_matcher = catalog.matcher
+        self._targets = {}  # catalog index -> indices into skills
+        self._unknown = []
+        for i, skill in enumerate(self.skills):
+            idx = catalog.index(skill)
+            if idx is None:
+                self._unknown.append(i)
+            else:
+                self._targets.setdefault(idx, []).append(i)
+        self._unknown_matcher = SkillMatcher([self.skills[i] for i in self._unknown]) if self._unknown else None
+
+    def match_indices(self, text):
+        """Return the sorted indices of all listed skills found in text."""
+        targets = self._targets
+        hits = {i for idx in self._catalog_matcher.match_indices(text) for i in targets.get(idx, ())}
+        if self._unknown_matcher is not None:
+            hits.update(self._unknown[j] for j in self._unknown_matcher.match_indices(text))
+        return sorted(hits)
+
+    def find(self, text):
+        """Return the listed skills found in text, in list order."""
+        return [self.skills[i] for i in self.match_indices(text)]
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(catalog, skills):
+    return CatalogMatcher(catalog, skills)
+
+
+def get_skill_matcher(skills):
+    """Return a matcher for this skill list, built once per process and catalog version."""
+    return _cached_matcher(get_catalog(), tuple(skills))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the skill catalog into its matcher artifact.")
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--out", default=ARTIFACT_PATH)
+    parser.add_argument("--check", action="store_true", help="only verify that --out was compiled from --source")
+    args = parser.parse_args(argv)
+
+    catalog = read_catalog(args.source)
+    from backend.job_profiles import ALL_SKILLS
+
+    unknown = [s for s in ALL_SKILLS if catalog.index(s) is None]
+    for skill in unknown:
+        print(f"JOB_PROFILES skill not in the catalog: {skill}")
+    if unknown:
+        return 1
+
+    if args.check:
+        try:
+            with open(args.out, "r", encoding="utf-8") as f:
+                current = json.load(f)
+        except (OSError, ValueError):
+            current = {}
+        if current != json.loads(json.dumps(catalog.to_artifact())):
+            print(f"{args.out} is stale; run python -m backend.skill_catalog")
+            return 1
+        print(f"{args.out} is up to date ({catalog.label})")
+        return 0
+
+    write_artifact(catalog, args.out)
+    n_aliases = sum(len(a) for a in catalog.aliases)
+    print(f"Compiled {len(catalog)} skills, {n_aliases} aliases, "
+          f"{len(catalog.matcher.to_state()['goto'])} automaton states ({catalog.label}) -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+# backend/skill_matcher.py
+import re
+from collections import deque
+
+# Text is split into word runs and single non-word characters, so "node.js"
+# becomes ["node", ".", "js"] and word boundaries fall out of the tokenization.
+_TOKEN_RE = re.compile(r"\w+|[^\w]")
+
+
+def normalize(text):
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(normalize(text))
+
+
+class SkillMatcher:
+    """
+    Finds every catalog skill in a text with one pass over its tokens.
+
+    Skills are compiled into an Aho-Corasick automaton over tokens, so the
+    cost of a scan depends on the text length, not on the catalog size.
+    Overlapping skills ("Statistics" inside "Basic Statistics") are all reported.
+    aliases is an optional list of (alias, skill index) pairs: extra spellings
+    that report the skill at that index.
+    """
+
+    def __init__(self, skills, aliases=()):
+        self.skills = list(skills)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        forms = list(enumerate(self.skills)) + [(idx, alias) for alias, idx in aliases]
+        for idx, form in forms:
+            tokens = tokenize(form)
+            if not tokens:
+                continue
+            node = 0
+            for tok in tokens:
+                nxt = self._goto[node].get(tok)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][tok] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            if idx not in self._out[node]:
+                self._out[node] = self._out[node] + (idx,)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for tok, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and tok not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(tok, 0)
+                fail[child] = target if target != child else 0
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+
+    def match_indices(self, text):
+        """Return the sorted catalog indices of all skills found in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set()
+        node = 0
+        for tok in tokenize(text):
+            while node and tok not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(tok, 0)
+            if out[node]:
+                hits.update(out[node])
+        return sorted(hits)
+
+    def find(self, text):
+        """Return the skills found in text, in catalog order."""
+        return [self.skills[i] for i in self.match_indices(text)]
+
+    # ----- serialization (the compiled skill catalog stores the automaton) -----
+    def to_state(self):
+        """The automaton as JSON-friendly lists."""
+        return {"goto": self._goto, "fail": self._fail, "out": [list(o) for o in self._out]}
+
+    @classmethod
+    def from_state(cls, skills, state):
+        """Rebuild a matcher from to_state() output without recompiling it."""
+        matcher = cls.__new__(cls)
+        matcher.skills = list(skills)
+        matcher._goto = state["goto"]
+        matcher._fail = state["fail"]
+        matcher._out = [tuple(o) for o in state["out"]]
+        return matcher
@@ -0,0 +1,100 @@
+# backend/tfidf_scorer.py
+import os
+import tempfile
+import threading
+
+# joblib / sklearn are imported where they are used: they cost well over a second
+# of start-up, and most analyses never ask for a TF-IDF score
+from backend.job_profiles import JOB_PROFILES
+from backend.parse_cache import get_parse_cache
+
+DEFAULT_VECTORIZER_PATH = os.path.join("data", "tfidf_vectorizer.joblib")
+FIT_MAX_RESUMES = 2000      # most recently parsed resumes that go into the IDF corpus
+REFIT_BELOW_RESUMES = 50    # a vectorizer fitted on fewer resumes is refitted once more have been parsed
+
+_lock = threading.Lock()
+_vectorizers = {}
+
+
+def _jd_corpus():
+    docs = []
+    for role, profile in JOB_PROFILES.items():
+        docs.append(f"{role}\n{profile['jd']}\n{', '.join(profile['skills'])}")
+    return docs
+
+
+def fit_vectorizer(resume_texts=(), jd_texts=(), path=DEFAULT_VECTORIZER_PATH):
+    """
+    Fit the TF-IDF vectorizer on all JOB_PROFILES JDs plus the given JDs/resumes
+    and persist it to path. Call again whenever the corpus should be refreshed.
+    """
+    resume_texts = [t for t in resume_texts if t]
+    import joblib
+    import sklearn
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    corpus = _jd_corpus() + [t for t in jd_texts if t] + resume_texts
+    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True)
+    vectorizer.fit(corpus)
+
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    # dump next to the model and swap it in, so another process never loads a half-written file
+    fd, tmp = tempfile.mkstemp(dir=folder or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            joblib.dump({"sklearn_version": sklearn.__version__, "resume_docs": len(resume_texts),
+                         "vectorizer": vectorizer}, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    with _lock:
+        _vectorizers[path] = vectorizer
+    return vectorizer
+
+
+def get_vectorizer(path=DEFAULT_VECTORIZER_PATH):
+    """
+    Fitted vectorizer shared by every session: memory first, then disk, fitting
+    only if neither has one. Fits use the JOB_PROFILES JDs plus the resume texts
+    in the parse cache; a saved fit from a nearly empty cache (a fresh install)
+    is redone once more resumes have been parsed.
+    """
+    with _lock:
+        vectorizer = _vectorizers.get(path)
+    if vectorizer is not None:
+        return vectorizer
+
+    if os.path.exists(path):
+        import joblib
+        import sklearn
+
+        try:
+            saved = joblib.load(path)
+            resume_docs = saved.get("resume_docs", 0)
+            stale = resume_docs < REFIT_BELOW_RESUMES and get_parse_cache().disk_items() > resume_docs
+            if saved.get("sklearn_version") == sklearn.__version__ and not stale:
+                with _lock:
+                    _vectorizers[path] = saved["vectorizer"]
+                return saved["vectorizer"]
+        except Exception:
+            pass  # unreadable, from another sklearn version or stale -> refit below
+    return fit_vectorizer(resume_texts=get_parse_cache().texts(FIT_MAX_RESUMES), path=path)
+
+
+def tfidf_scores(resume_texts, jd_text, path=DEFAULT_VECTORIZER_PATH):
+    """
+    Cosine similarity (0-100) of each resume to the JD, computed as one sparse
+    matrix product. TF-IDF rows are L2-normalised, so the dot product is the cosine.
+    """
+    vectorizer = get_vectorizer(path)
+    resumes = vectorizer.transform([t or "" for t in resume_texts])
+    jd = vectorizer.transform([jd_text or ""])
+    sims = (resumes @ jd.T).toarray().ravel()
+    return [round(100 * float(s), 2) for s in sims]
+
+
+def tfidf_score(resume_text, jd_text, path=DEFAULT_VECTORIZER_PATH):
+    return tfidf_scores([resume_text], jd_text, path)[0]
@@ -0,0 +1,67 @@
+# backend/timing.py
+"""
+Lightweight per-stage timing for the analysis hot path.
+
+    spans = Spans()
+    with spans.span("parse"):
+        ...
+    record["timings"] = spans.timings   # {"parse": 12.3, ...} in milliseconds
+
+Set RESUME_TIMINGS=0 to turn it off: span() then hands back one shared no-op
+context manager and timings stays empty.
+"""
+import os
+import time
+
+# stage names used by the analysis paths, in pipeline order (for display)
+STAGES = ("parse", "details", "skills", "score", "tfidf", "embedding", "template", "docx", "index")
+
+TIMINGS_ENABLED = os.environ.get("RESUME_TIMINGS", "1").lower() not in ("0", "false", "no", "off")
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter_ns() - self.start) / 1e6
+        self.timings[self.name] = round(self.timings.get(self.name, 0.0) + ms, 3)
+        return False
+
+
+class Spans:
+    """Wall-clock milliseconds per named stage of one analysis; repeated names add up."""
+
+    __slots__ = ("timings", "enabled")
+
+    def __init__(self, enabled=None):
+        self.timings = {}
+        self.enabled = TIMINGS_ENABLED if enabled is None else enabled
+
+    def span(self, name):
+        return _Span(self.timings, name) if self.enabled else _NULL_SPAN
+
+
+def file_type(filename):
+    """Lower-case extension without the dot ("pdf", "docx", ...), or "" if there is none."""
+    return filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+"""
+Reproducible benchmarks for the resume pipeline's hot paths.
+
+    python -m benchmarks.corpus out/corpus --docs 200 --seed 7    # write a synthetic corpus
+    python -m benchmarks.run --docs 60 --json baseline.json        # time every stage
+    python -m benchmarks.run --docs 60 --compare baseline.json     # flag regressions
+"""
@@ -0,0 +1,194 @@
+# benchmarks/corpus.py
+"""
+Seeded generator of synthetic resumes as PDF, DOCX and TXT.
+
+Skills are drawn from JOB_PROFILES and the skill catalog. The same seed
+and settings always give the same documents, byte for byte, so timings from
+different runs are comparable.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import textwrap
+import zipfile
+
+from backend.job_profiles import JOB_PROFILES
+from backend.scoring import build_catalog
+from backend.skill_catalog import SOURCE_PATH as CATALOG_PATH, read_catalog
+
+FORMATS = ("pdf", "docx", "txt")
+LINE_WIDTH = 90
+PDF_LINES_PER_PAGE = 50
+
+FIRST_NAMES = ["Asha", "Ravi", "Maria", "John", "Wei", "Fatima", "Lucas", "Priya", "Omar", "Elena",
+               "Kenji", "Sara", "David", "Aisha", "Mateo", "Nina", "Arjun", "Chloe", "Ivan", "Zara"]
+LAST_NAMES = ["Sharma", "Garcia", "Smith", "Chen", "Khan", "Silva", "Patel", "Rossi", "Novak", "Kim",
+              "Okafor", "Müller", "Nair", "Lopez", "Tanaka", "Brown", "Iyer", "Costa", "Haddad", "Reddy"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech",
+             "Hooli", "Vandelay", "Soylent", "Cyberdyne"]
+FILLER = ("designed delivered improved built maintained led owned automated migrated reduced scaled "
+          "reviewed mentored shipped tested documented analysed optimized the a of for with across "
+          "team product platform customers pipeline service reports latency costs quality releases "
+          "stakeholders features dashboards workflows data systems users projects processes").split()
+
+
+def skill_pool(catalog_path=CATALOG_PATH):
+    """Every role skill plus the catalog file's skills (canonical names), deduplicated."""
+    extra = read_catalog(catalog_path).names if os.path.exists(catalog_path) else []
+    return build_catalog(*(p["skills"] for p in JOB_PROFILES.values()), extra)
+
+
+def _sentence(rng, skill=None, words=12):
+    parts = rng.choices(FILLER, k=words)
+    if skill:
+        parts.insert(rng.randrange(len(parts) + 1), skill)
+    return " ".join(parts).capitalize() + "."
+
+
+def generate_resume(rng, role, pool, length=400, skill_density=0.6):
+    """
+    One resume as {"role", "name", "email", "skills", "lines"}.
+    length is roughly the word count; skill_density is the share of the role's
+    skills the candidate has (a few off-role skills are always added).
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f"{first} {last}"
+    email = f"{first.lower()}.{last.lower()}{rng.randrange(100)}@example.com".encode("ascii", "ignore").decode()
+    role_skills = JOB_PROFILES[role]["skills"]
+    have = rng.sample(role_skills, round(len(role_skills) * min(max(skill_density, 0.0), 1.0)))
+    others = [s for s in pool if s not in role_skills]
+    have += rng.sample(others, min(len(others), rng.randint(1, 4)))
+
+    lines = [name, f"{email} | +1 555 {rng.randrange(10**7):07d} | linkedin.com/in/{first.lower()}{last.lower()}", ""]
+    lines += ["SUMMARY", *textwrap.wrap(f"{role} with {rng.randint(1, 12)} years of experience. " + _sentence(rng), LINE_WIDTH), ""]
+    lines += ["SKILLS", *textwrap.wrap(", ".join(have), LINE_WIDTH), "", "EXPERIENCE"]
+
+    words = sum(len(line.split()) for line in lines)
+    mentions = list(have)
+    while words < length:
+        lines.append(f"{role} - {rng.choice(COMPANIES)} ({rng.randint(2008, 2020)}-{rng.randint(2021, 2025)})")
+        for _ in range(rng.randint(3, 6)):
+            skill = mentions.pop() if mentions and rng.random() < 0.5 else None
+            sentence = _sentence(rng, skill, rng.randint(8, 18))
+            lines += textwrap.wrap("- " + sentence, LINE_WIDTH)
+            words += len(sentence.split())
+        lines.append("")
+    lines += ["EDUCATION", f"B.Tech in Computer Science, {rng.choice(COMPANIES)} University"]
+    return {"role": role, "name": name, "email": email, "skills": have, "lines": lines}
+
+
+# ----- renderers -----
+def to_txt(resume):
+    return ("\n".join(resume["lines"]) + "\n").encode("utf-8")
+
+
+def to_docx(resume):
+    from docx import Document
+
+    doc = Document()
+    for line in resume["lines"]:
+        doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return _fixed_zip_times(buf.getvalue())
+
+
+def _fixed_zip_times(data):
+    """Rewrite a zip with constant entry timestamps so equal content gives equal bytes."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(zipfile.ZipInfo(info.filename, date_time=(1980, 1, 1, 0, 0, 0)), src.read(info.filename),
+                         compress_type=zipfile.ZIP_DEFLATED)
+    return out.getvalue()
+
+
+def _pdf_text(line):
+    line = line.encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def to_pdf(resume):
+    """A plain text PDF (Helvetica, PDF_LINES_PER_PAGE lines per page), written without any PDF library."""
+    lines = resume["lines"]
+    pages = [lines[i:i + PDF_LINES_PER_PAGE] for i in range(0, len(lines), PDF_LINES_PER_PAGE)] or [[]]
+    objects = [None, None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for page in pages:
+        ops = "".join(f"({_pdf_text(line)}) '\n" for line in page)
+        stream = f"BT /F1 10 Tf 14 TL 50 806 Td\n{ops}ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        kids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.write(b"".join(b"%010d 00000 n \n" % off for off in offsets))
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+RENDERERS = {"pdf": to_pdf, "docx": to_docx, "txt": to_txt}
+
+
+def generate_corpus(docs=60, seed=7, formats=FORMATS, length=400, skill_density=0.6, catalog_path=CATALOG_PATH):
+    """
+    docs synthetic resumes as dicts with filename, format, role, skills and the
+    file bytes. Roles and formats rotate so every format gets every role.
+    """
+    rng = random.Random(seed)
+    pool = skill_pool(catalog_path)
+    roles = list(JOB_PROFILES)
+    corpus = []
+    for i in range(docs):
+        fmt = formats[i % len(formats)]
+        resume = generate_resume(rng, roles[(i // len(formats)) % len(roles)], pool, length, skill_density)
+        corpus.append({
+            "filename": f"resume_{i:05d}.{fmt}",
+            "format": fmt,
+            "role": resume["role"],
+            "skills": resume["skills"],
+            "bytes": RENDERERS[fmt](resume),
+        })
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus to a folder.")
+    parser.add_argument("folder")
+    parser.add_argument("--docs", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated: pdf,docx,txt")
+    parser.add_argument("--length", type=int, default=400, help="approximate words per resume")
+    parser.add_argument("--density", type=float, default=0.6, help="share of the role's skills each resume has")
+    args = parser.parse_args(argv)
+
+    formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+    corpus = generate_corpus(args.docs, args.seed, formats, args.length, args.density)
+    os.makedirs(args.folder, exist_ok=True)
+    for doc in corpus:
+        with open(os.path.join(args.folder, doc["filename"]), "wb") as f:
+            f.write(doc["bytes"])
+    with open(os.path.join(args.folder, "labels.jsonl"), "w", encoding="utf-8") as f:
+        for doc in corpus:
+            f.write(json.dumps({k: doc[k] for k in ("filename", "role", "skills")}) + "\n")
+    print(f"Wrote {len(corpus)} resumes to {args.folder}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,234 @@
+# benchmarks/run.py
+"""
+Time each stage of the single-resume analysis on a synthetic corpus.
+
+    python -m benchmarks.run --docs 60 --repeat 3 --json baseline.json
+    python -m benchmarks.run --docs 60 --repeat 3 --compare baseline.json --threshold 0.15
+
+Stages run in the analyzer page's order on every document. Per stage it reports
+throughput, p50/p95 latency and peak Python heap; the heap is measured in a
+separate pass (tracemalloc would distort the timings). Parsing bypasses the
+parse cache so every call does the real work.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from backend.job_profiles import ALL_SKILLS, JOB_PROFILES
+from backend.pdf_backends import resolve_backend
+from backend.resume_parser import _extract_text_and_image, extract_basic_details, extract_skills_from_text
+from backend.resume_template import build_docx_from_template_text, generate_resume_template
+from backend.results_store import append_result
+from backend.skill_catalog import get_skill_matcher
+from benchmarks.corpus import FORMATS, generate_corpus
+
+STAGES = [
+    "extract_text_and_image",
+    "extract_basic_details",
+    "extract_skills_from_text",
+    "score",
+    "generate_resume_template",
+    "build_docx_from_template_text",
+    "append_result",
+]
+
+
+def score(text, jd_skills):
+    """The analyzer page's scoring: one scan over ALL_SKILLS, then coverage of the role's skills."""
+    found = set(get_skill_matcher(ALL_SKILLS).find(text))
+    matched = [s for s in jd_skills if s in found]
+    missing = [s for s in jd_skills if s not in matched]
+    return matched, missing, round(100 * len(matched) / (len(jd_skills) or 1), 2)
+
+
+def analyze(doc, results_path, clock):
+    """Run every stage on one document; clock(stage) is a context manager around each one."""
+    profile = JOB_PROFILES[doc["role"]]
+    with clock("extract_text_and_image"):
+        text, _, _ = _extract_text_and_image(doc["bytes"], doc["filename"])
+    with clock("extract_basic_details"):
+        details = extract_basic_details(text)
+    with clock("extract_skills_from_text"):
+        extract_skills_from_text(text)
+    with clock("score"):
+        matched, missing, value = score(text, profile["skills"])
+    with clock("generate_resume_template"):
+        template = generate_resume_template(doc["role"], details["name"], matched, missing, profile["jd"])
+    with clock("build_docx_from_template_text"):
+        build_docx_from_template_text(template)
+    with clock("append_result"):
+        append_result({
+            "timestamp": datetime.now().isoformat(),
+            "candidate_name": details["name"] or doc["filename"],
+            "job_title": doc["role"],
+            "score": value,
+            "jd_skills": profile["skills"],
+            "resume_skills": matched,
+            "missing_skills": missing,
+        }, results_path)
+
+
+class _Timer:
+    def __init__(self, sink, key):
+        self.sink = sink
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.sink.setdefault(self.key, []).append(time.perf_counter() - self.start)
+
+
+class _HeapPeak:
+    def __init__(self, sink, key):
+        self.sink = sink
+        self.key = key
+
+    def __enter__(self):
+        tracemalloc.reset_peak()
+        self.base = tracemalloc.get_traced_memory()[0]
+
+    def __exit__(self, *exc):
+        peak = tracemalloc.get_traced_memory()[1] - self.base
+        self.sink[self.key] = max(self.sink.get(self.key, 0), peak)
+
+
+def _summary(durations, peak=None):
+    ms = np.asarray(durations) * 1000.0
+    total = float(ms.sum()) / 1000.0
+    row = {
+        "calls": len(ms),
+        "total_s": round(total, 4),
+        "per_sec": round(len(ms) / total, 2) if total else 0.0,
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+    }
+    if peak is not None:
+        row["peak_kb"] = round(peak / 1024, 1)
+    return row
+
+
+def benchmark(docs=60, seed=7, formats=FORMATS, length=400, skill_density=0.6, repeat=3):
+    corpus = generate_corpus(docs, seed, formats, length, skill_density)
+    timings = {}
+    peaks = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        results_path = os.path.join(tmp, "results.jsonl")
+        analyze(corpus[0], results_path, lambda stage: _Timer({}, stage))  # warm caches and imports
+
+        for _ in range(repeat):
+            for doc in corpus:
+                def clock(stage, fmt=doc["format"]):
+                    key = f"{stage}.{fmt}" if stage == "extract_text_and_image" else stage
+                    return _Timer(timings, key)
+                analyze(doc, results_path, clock)
+
+        tracemalloc.start()
+        try:
+            for doc in corpus:
+                analyze(doc, results_path, lambda stage: _HeapPeak(peaks, stage))
+        finally:
+            tracemalloc.stop()
+
+    parse = [t for fmt in formats for t in timings.get(f"extract_text_and_image.{fmt}", [])]
+    stages = {"extract_text_and_image": _summary(parse, peaks["extract_text_and_image"])}
+    stages.update({s: _summary(timings[s], peaks[s]) for s in STAGES[1:]})
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "docs": docs,
+            "seed": seed,
+            "formats": list(formats),
+            "length": length,
+            "skill_density": skill_density,
+            "repeat": repeat,
+            "pdf_backend": resolve_backend(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "stages": stages,
+        "parse_by_format": {fmt: _summary(timings[f"extract_text_and_image.{fmt}"]) for fmt in formats},
+    }
+
+
+def compare(report, baseline, threshold=0.10):
+    """
+    Stages whose p50 or p95 grew by more than threshold (0.10 = 10%) against
+    baseline, as (stage, metric, old, new) tuples.
+    """
+    regressions = []
+    for section in ("stages", "parse_by_format"):
+        for name, row in report[section].items():
+            old = baseline.get(section, {}).get(name)
+            if not old:
+                continue
+            for metric in ("p50_ms", "p95_ms"):
+                if old[metric] and row[metric] > old[metric] * (1 + threshold):
+                    regressions.append((name, metric, old[metric], row[metric]))
+    return regressions
+
+
+def print_report(report, baseline=None):
+    header = f"{'stage':<32}{'calls':>7}{'per sec':>10}{'p50 ms':>10}{'p95 ms':>10}{'peak KB':>10}"
+    if baseline:
+        header += f"{'p50 vs base':>13}"
+    print(header)
+    print("-" * len(header))
+    rows = list(report["stages"].items()) + [(f"  parse {fmt}", r) for fmt, r in report["parse_by_format"].items()]
+    for name, r in rows:
+        line = (f"{name:<32}{r['calls']:>7}{r['per_sec']:>10}{r['p50_ms']:>10}{r['p95_ms']:>10}"
+                f"{r.get('peak_kb', ''):>10}")
+        if baseline:
+            section, key = ("parse_by_format", name.split()[-1]) if name.startswith("  ") else ("stages", name)
+            old = baseline.get(section, {}).get(key)
+            if old and old["p50_ms"]:
+                line += f"{(r['p50_ms'] / old['p50_ms'] - 1) * 100:>+12.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume analysis stages on a synthetic corpus.")
+    parser.add_argument("--docs", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated: pdf,docx,txt")
+    parser.add_argument("--length", type=int, default=400, help="approximate words per resume")
+    parser.add_argument("--density", type=float, default=0.6, help="share of the role's skills each resume has")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over the corpus")
+    parser.add_argument("--json", dest="json_out", help="write the report (a baseline for --compare) here")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p50/p95 growth before failing")
+    args = parser.parse_args(argv)
+
+    formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+    report = benchmark(args.docs, args.seed, formats, args.length, args.density, max(1, args.repeat))
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        settings = ("docs", "seed", "formats", "length", "skill_density")
+        if any(baseline["meta"].get(k) != report["meta"][k] for k in settings):
+            print("Warning: baseline was run with different corpus settings.", file=sys.stderr)
+    print_report(report, baseline)
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if baseline:
+        regressions = compare(report, baseline, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old} -> {new} ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())